@@ -5,17 +5,354 @@
 智能识别和筛选文献中的关键章节，提高信息提取效率
 """
 
+import os
 import re
-from typing import Dict, List, Any, Optional, Set
+import sys
+import heapq
+import functools
+from collections import defaultdict, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Dict, List, Any, Optional, Set, Tuple, Pattern, Iterator
 import logging
 
 from utils.logger import LoggerMixin
 
 logger = logging.getLogger(__name__)
 
+# 预定义章节模式
+SECTION_PATTERNS = {
+    # 英文章节模式
+    'abstract': [
+        r'\babstract\b',
+        r'\bsummary\b',
+        r'\bexecutive\s+summary\b'
+    ],
+    'introduction': [
+        r'\bintroduction\b',
+        r'\bbackground\b',
+        r'\boverview\b',
+        r'\bpreamble\b'
+    ],
+    'methods': [
+        r'\bmethods?\b',
+        r'\bmethodology\b',
+        r'\bmaterials?\s+and\s+methods?\b',
+        r'\bexperimental\s+(?:design|procedure|setup)\b',
+        r'\bstudy\s+design\b'
+    ],
+    'results': [
+        r'\bresults?\b',
+        r'\bfindings?\b',
+        r'\boutcomes?\b',
+        r'\bobservations?\b'
+    ],
+    'discussion': [
+        r'\bdiscussion\b',
+        r'\banalysis\b',
+        r'\binterpretation\b',
+        r'\bimplications?\b'
+    ],
+    'conclusion': [
+        r'\bconclusions?\b',
+        r'\bconclusion\s+and\s+future\s+work\b',
+        r'\bsummary\s+and\s+conclusions?\b',
+        r'\bfinal\s+remarks?\b'
+    ],
+    
+    # 中文章节模式
+    'abstract_zh': [
+        r'摘要',
+        r'概要',
+        r'内容提要',
+        r'文章摘要'
+    ],
+    'introduction_zh': [
+        r'引言',
+        r'前言',
+        r'背景',
+        r'概述',
+        r'绪论'
+    ],
+    'methods_zh': [
+        r'方法',
+        r'材料与方法',
+        r'研究方法',
+        r'实验方法',
+        r'方法学'
+    ],
+    'results_zh': [
+        r'结果',
+        r'实验结果',
+        r'研究结果',
+        r'发现',
+        r'观察结果'
+    ],
+    'discussion_zh': [
+        r'讨论',
+        r'分析',
+        r'分析与讨论',
+        r'结果分析'
+    ],
+    'conclusion_zh': [
+        r'结论',
+        r'总结',
+        r'小结',
+        r'结语',
+        r'结论和建议'
+    ],
+    
+    # 排除章节模式
+    'references': [
+        r'\breferences?\b',
+        r'\bbibliography\b',
+        r'\bworks?\s+cited\b',
+        r'参考文献',
+        r'文献引用'
+    ],
+    'acknowledgments': [
+        r'\backnowledg?ments?\b',
+        r'\backnowledg?ements?\b',
+        r'\bthanks?\b',
+        r'致谢',
+        r'鸣谢'
+    ],
+    'funding': [
+        r'\bfunding\b',
+        r'\bfinancial\s+support\b',
+        r'\bgrants?\b',
+        r'资助',
+        r'基金',
+        r'资金支持'
+    ],
+    'appendix': [
+        r'\bappendix\b',
+        r'\bappendices\b',
+        r'\bsupplementary\s+(?:material|information)\b',
+        r'附录',
+        r'补充材料'
+    ],
+    'author_info': [
+        r'\bauthor\s+(?:information|contributions?|details?)\b',
+        r'\bcompeting\s+interests?\b',
+        r'\bconflicts?\s+of\s+interests?\b',
+        r'作者信息',
+        r'作者贡献',
+        r'利益冲突'
+    ]
+}
+
+_PATTERN_FLAGS = re.IGNORECASE | re.MULTILINE
+
+# 章节类型字符串驻留，后续比较和字典查找可直接按引用进行
+_SECTION_TYPES = {section_type: sys.intern(section_type) for section_type in SECTION_PATTERNS}
+
+# 中英文章节合并后的基础类型
+_BASE_TYPES = {
+    section_type: sys.intern(section_type.replace('_zh', ''))
+    for section_type in SECTION_PATTERNS
+}
+
+# 章节边界，end 在确定下一个边界后填充
+Boundary = namedtuple('Boundary', 'start line_start type title end')
+
+# 每行开头的非字母前缀（数字、下划线、标点和空白），其后第一个字母即该行唯一可能的标题起点
+_LINE_PREFIX_RE = re.compile(r'^(?:[^\w\n]|[\d_])*', re.MULTILINE)
+
+# 前缀在行内的延续部分：\w 还包含罗马数字、带圈数字、上标等非字母的数字字符（如 Ⅱ、①、²），
+# 正则无法按 str.isalpha 区分，遇到时逐个跳过后继续匹配
+_PREFIX_REST_RE = re.compile(r'(?:[^\w\n]|[\d_])*')
+
+# 忽略大小写匹配时与 ASCII 字母等价、但 str.lower() 不会转换成该字母的字符
+_EXTRA_CASE_FOLDS = {'İ': 'i', 'ı': 'i', 'ſ': 's'}
+
+# 章节优先级和权重
+_SECTION_PRIORITY = {
+    'abstract': 1.0,
+    'introduction': 0.8,
+    'methods': 0.9,
+    'results': 1.0,
+    'discussion': 0.8,
+    'conclusion': 0.7,
+    'background': 0.6,
+    'literature_review': 0.5,
+    'limitations': 0.6,
+    'future_work': 0.4
+}
+_DEFAULT_PRIORITY = 0.3
+
+# 快速探测常见章节标题，用于判断文本是否具有章节结构
+_QUICK_PROBE = re.compile(r'\b(?:abstract|introduction|methods?|results?)\b|摘要|方法|结果', re.IGNORECASE)
+
+# 含有正则元字符的模式不能按字面量匹配
+_REGEX_META_RE = re.compile(r'[\\^$.|?*+()\[\]{}]')
+
+
+def _title_key(pattern: str) -> str:
+    """取模式匹配到的第一个字符（小写），用于按候选位置的首字符筛选模式"""
+    if pattern.startswith(r'\b'):
+        pattern = pattern[2:]
+    return pattern[0].lower()
+
+
+@functools.lru_cache(maxsize=1)
+def _compile_section_patterns() -> Tuple[Dict[str, List[Pattern]], Dict[str, Tuple[Tuple[Pattern, str], ...]]]:
+    """
+    编译章节识别模式（进程内只执行一次）
+
+    Returns:
+        (按章节类型分组的正则列表, 按首字符分组的 (正则, 章节类型) 元组)
+    """
+    compiled_patterns = {
+        section_type: [re.compile(pattern, _PATTERN_FLAGS) for pattern in patterns]
+        for section_type, patterns in SECTION_PATTERNS.items()
+    }
+
+    # 同一位置上较长的模式优先尝试，与去重时保留最完整标题的规则一致
+    entries = sorted(
+        ((pattern, compiled, _SECTION_TYPES[section_type])
+         for section_type, patterns in SECTION_PATTERNS.items()
+         for pattern, compiled in zip(patterns, compiled_patterns[section_type])),
+        key=lambda entry: len(entry[0]), reverse=True
+    )
+
+    patterns_by_key = defaultdict(list)
+    for pattern, compiled, section_type in entries:
+        patterns_by_key[_title_key(pattern)].append((compiled, section_type))
+
+    return compiled_patterns, {key: tuple(patterns) for key, patterns in patterns_by_key.items()}
+
+
+_COMPILED_PATTERNS, _TITLE_PATTERNS = _compile_section_patterns()
+
+
+def _required_literal(pattern: str) -> str:
+    """
+    取出模式开头必须出现的字面量（小写），用于快速预筛选
+
+    例如 \\bmethods?\\b -> 'method'，\\backnowledg?ments?\\b -> 'acknowled'
+    """
+    if pattern.startswith(r'\b'):
+        pattern = pattern[2:]
+    meta_match = _REGEX_META_RE.search(pattern)
+    if meta_match is None:
+        return pattern.lower()
+    literal = pattern[:meta_match.start()]
+    # 紧随其后的 ? / * 表示最后一个字符可省略
+    if pattern[meta_match.start()] in '?*':
+        literal = literal[:-1]
+    return literal.lower()
+
+
+def _build_section_needles() -> Tuple[str, ...]:
+    """构建覆盖所有章节模式的最小预筛选关键词集合"""
+    literals = {_required_literal(pattern) for patterns in SECTION_PATTERNS.values() for pattern in patterns}
+    # 包含其他关键词的关键词是多余的
+    return tuple(sorted(
+        literal for literal in literals
+        if not any(other != literal and other in literal for other in literals)
+    ))
+
+
+# 任一章节标题都必然包含其中某个关键词；一个都不包含的文本无需正则扫描
+_SECTION_NEEDLES = _build_section_needles()
+
+# 不区分大小写的关键词搜索，避免为预筛选复制整篇文本的小写版本
+_SECTION_NEEDLE_SEARCH = re.compile('|'.join(map(re.escape, _SECTION_NEEDLES)), re.IGNORECASE).search
+
+
+def _iter_title_matches(text: str) -> Iterator[Tuple[int, int, str, str]]:
+    """
+    按位置顺序遍历文本中所有可能的章节标题
+
+    标题前缀不能含字母，因此每行只有第一个字母处可能是标题起点：
+    先定位各行的非字母前缀，只在前缀足够短的位置上尝试首字符相同的模式。
+
+    Yields:
+        (起始位置, 行首位置, 章节类型, 标题文本)
+    """
+    text_length = len(text)
+    for prefix in _LINE_PREFIX_RE.finditer(text):
+        start_pos = prefix.end()
+        while start_pos < text_length and text[start_pos] != '\n' and not text[start_pos].isalpha():
+            start_pos = _PREFIX_REST_RE.match(text, start_pos + 1).end()
+        if start_pos == text_length:
+            continue
+
+        char = text[start_pos]
+        candidates = _TITLE_PATTERNS.get(_EXTRA_CASE_FOLDS.get(char) or char.lower())
+        if candidates is None:
+            continue
+
+        # 去除前缀首尾空白（只移动下标，不生成子串），前面有较多字符的不是章节标题（编号除外）
+        line_start = prefix_start = prefix.start()
+        prefix_end = start_pos
+        while prefix_start < prefix_end and text[prefix_start].isspace():
+            prefix_start += 1
+        while prefix_end > prefix_start and text[prefix_end - 1].isspace():
+            prefix_end -= 1
+        if prefix_end - prefix_start > 10:
+            continue
+
+        for pattern, section_type in candidates:
+            match = pattern.match(text, start_pos)
+            if match:
+                yield start_pos, line_start, section_type, match.group()
+
+
+def _joined_length(spans: List[Tuple[int, int]]) -> int:
+    """计算多个片段以空行连接后的总长度"""
+    return sum(end - start for start, end in spans) + 2 * (len(spans) - 1)
+
+
+def _join_spans(text: str, spans: List[Tuple[int, int]], limit: Optional[int] = None) -> str:
+    """
+    以空行连接文本片段，超过限制长度时截断并追加省略号
+
+    Args:
+        text: 原始文本
+        spans: 片段位置列表 [(开始位置, 结束位置), ...]
+        limit: 结果最大长度，None 表示不限制
+
+    Returns:
+        连接后的文本
+    """
+    if limit is None or limit >= _joined_length(spans):
+        return '\n\n'.join(text[start:end] for start, end in spans)
+
+    # 只复制截断点之前需要的部分
+    parts = []
+    remaining = limit - 3
+    for i, (start, end) in enumerate(spans):
+        if i:
+            parts.append('\n\n'[:remaining])
+            remaining -= 2
+            if remaining <= 0:
+                break
+        parts.append(text[start:start + min(end - start, remaining)])
+        remaining -= end - start
+        if remaining <= 0:
+            break
+
+    return ''.join(parts) + '...'
+
+
 class SectionFilter(LoggerMixin):
     """章节过滤器"""
     
+    # 排除章节：只作为前一章节的结束位置，不作为章节输出
+    EXCLUDE_TYPES = frozenset({'references', 'acknowledgments', 'funding', 'appendix', 'author_info'})
+    
+    # 不同提取类型的相关章节（元组顺序即输出顺序）
+    RELEVANT_SECTIONS = {
+        'standard': ('abstract', 'introduction', 'methods', 'results', 'discussion', 'conclusion'),
+        'methodology': ('abstract', 'introduction', 'methods', 'materials'),
+        'results_focused': ('abstract', 'methods', 'results', 'discussion'),
+        'background_focused': ('abstract', 'introduction', 'background', 'literature_review'),
+        'biomarker': ('abstract', 'introduction', 'methods', 'results', 'discussion'),
+        'clinical': ('abstract', 'methods', 'results', 'clinical_implications', 'conclusion')
+    }
+    
     def __init__(self, config: Dict[str, Any]):
         """
         初始化章节过滤器
@@ -30,139 +367,16 @@ class SectionFilter(LoggerMixin):
         
         # 预定义章节模式
         self._init_section_patterns()
+        
+        # 同一文本的章节位置缓存（智能选择和分布分析会重复提取同一文本）
+        self._section_spans_cached = functools.lru_cache(maxsize=64)(self._extract_section_spans)
     
     def _init_section_patterns(self):
-        """初始化章节识别模式"""
-        self.section_patterns = {
-            # 英文章节模式
-            'abstract': [
-                r'\babstract\b',
-                r'\bsummary\b',
-                r'\bexecutive\s+summary\b'
-            ],
-            'introduction': [
-                r'\bintroduction\b',
-                r'\bbackground\b',
-                r'\boverview\b',
-                r'\bpreamble\b'
-            ],
-            'methods': [
-                r'\bmethods?\b',
-                r'\bmethodology\b',
-                r'\bmaterials?\s+and\s+methods?\b',
-                r'\bexperimental\s+(?:design|procedure|setup)\b',
-                r'\bstudy\s+design\b'
-            ],
-            'results': [
-                r'\bresults?\b',
-                r'\bfindings?\b',
-                r'\boutcomes?\b',
-                r'\bobservations?\b'
-            ],
-            'discussion': [
-                r'\bdiscussion\b',
-                r'\banalysis\b',
-                r'\binterpretation\b',
-                r'\bimplications?\b'
-            ],
-            'conclusion': [
-                r'\bconclusions?\b',
-                r'\bconclusion\s+and\s+future\s+work\b',
-                r'\bsummary\s+and\s+conclusions?\b',
-                r'\bfinal\s+remarks?\b'
-            ],
-            
-            # 中文章节模式
-            'abstract_zh': [
-                r'摘要',
-                r'概要',
-                r'内容提要',
-                r'文章摘要'
-            ],
-            'introduction_zh': [
-                r'引言',
-                r'前言',
-                r'背景',
-                r'概述',
-                r'绪论'
-            ],
-            'methods_zh': [
-                r'方法',
-                r'材料与方法',
-                r'研究方法',
-                r'实验方法',
-                r'方法学'
-            ],
-            'results_zh': [
-                r'结果',
-                r'实验结果',
-                r'研究结果',
-                r'发现',
-                r'观察结果'
-            ],
-            'discussion_zh': [
-                r'讨论',
-                r'分析',
-                r'分析与讨论',
-                r'结果分析'
-            ],
-            'conclusion_zh': [
-                r'结论',
-                r'总结',
-                r'小结',
-                r'结语',
-                r'结论和建议'
-            ],
-            
-            # 排除章节模式
-            'references': [
-                r'\breferences?\b',
-                r'\bbibliography\b',
-                r'\bworks?\s+cited\b',
-                r'参考文献',
-                r'文献引用'
-            ],
-            'acknowledgments': [
-                r'\backnowledg?ments?\b',
-                r'\backnowledg?ements?\b',
-                r'\bthanks?\b',
-                r'致谢',
-                r'鸣谢'
-            ],
-            'funding': [
-                r'\bfunding\b',
-                r'\bfinancial\s+support\b',
-                r'\bgrants?\b',
-                r'资助',
-                r'基金',
-                r'资金支持'
-            ],
-            'appendix': [
-                r'\bappendix\b',
-                r'\bappendices\b',
-                r'\bsupplementary\s+(?:material|information)\b',
-                r'附录',
-                r'补充材料'
-            ],
-            'author_info': [
-                r'\bauthor\s+(?:information|contributions?|details?)\b',
-                r'\bcompeting\s+interests?\b',
-                r'\bconflicts?\s+of\s+interests?\b',
-                r'作者信息',
-                r'作者贡献',
-                r'利益冲突'
-            ]
-        }
-        
-        # 编译正则表达式
-        self.compiled_patterns = {}
-        for section_type, patterns in self.section_patterns.items():
-            self.compiled_patterns[section_type] = [
-                re.compile(pattern, re.IGNORECASE | re.MULTILINE)
-                for pattern in patterns
-            ]
+        """初始化章节识别模式（复用模块级预编译结果）"""
+        self.section_patterns = SECTION_PATTERNS
+        self.compiled_patterns = _COMPILED_PATTERNS
     
-    def identify_section_boundaries(self, text: str) -> List[Dict[str, Any]]:
+    def identify_section_boundaries(self, text: str) -> List[Boundary]:
         """
         识别文本中的章节边界
         
@@ -170,58 +384,47 @@ class SectionFilter(LoggerMixin):
             text: 文本内容
             
         Returns:
-            章节边界列表，每个元素包含 {type, start, end, title}
+            章节边界列表，每个元素为 Boundary(start, line_start, type, title, end)（不含排除章节）
         """
-        boundaries = []
-        
-        # 查找所有可能的章节标题
-        for section_type, patterns in self.compiled_patterns.items():
-            for pattern in patterns:
-                for match in pattern.finditer(text):
-                    start_pos = match.start()
-                    
-                    # 检查是否在行首或接近行首
-                    line_start = text.rfind('\n', 0, start_pos) + 1
-                    prefix = text[line_start:start_pos].strip()
-                    
-                    # 如果前面只有少量字符（如编号），认为是章节标题
-                    if len(prefix) <= 10 and not any(c.isalpha() for c in prefix):
-                        boundaries.append({
-                            'type': section_type,
-                            'start': start_pos,
-                            'title': match.group(0),
-                            'line_start': line_start
-                        })
-        
-        # 按位置排序
-        boundaries.sort(key=lambda x: x['start'])
-        
-        # 去重和合并相近的边界
-        filtered_boundaries = []
-        for boundary in boundaries:
-            # 检查是否与已有边界重叠
-            is_duplicate = False
-            for existing in filtered_boundaries:
-                if abs(boundary['start'] - existing['start']) < 50:
-                    # 选择更精确的匹配
-                    if len(boundary['title']) > len(existing['title']):
-                        filtered_boundaries.remove(existing)
-                        break
-                    else:
-                        is_duplicate = True
-                        break
-            
-            if not is_duplicate:
-                filtered_boundaries.append(boundary)
-        
-        # 计算结束位置
-        for i, boundary in enumerate(filtered_boundaries):
-            if i + 1 < len(filtered_boundaries):
-                boundary['end'] = filtered_boundaries[i + 1]['line_start']
-            else:
-                boundary['end'] = len(text)
+        return list(self._iter_boundaries(text))
+    
+    def _iter_boundaries(self, text: str) -> Iterator[Boundary]:
+        """
+        按位置顺序逐个生成章节边界，只缓存尚未确定结束位置的边界
         
-        return filtered_boundaries
+        Args:
+            text: 文本内容
+            
+        Yields:
+            Boundary(start, line_start, type, title, end)（不含排除章节）
+        """
+        # 快速预筛选：不含任何章节关键词的文本直接跳过
+        if not _SECTION_NEEDLE_SEARCH(text):
+            return
+        
+        # 已确定、等待下一边界作为结束位置的边界
+        closed = None
+        # 仍可能被相近的更精确标题替换的边界
+        current = None
+        
+        # 查找所有可能的章节标题（已按位置排序，且前缀符合行首编号规则）
+        for start_pos, line_start, section_type, title in _iter_title_matches(text):
+            # 去重和合并相近的边界，选择更精确的匹配
+            if current is not None and start_pos - current.start < 50:
+                if len(title) > len(current.title):
+                    current = Boundary(start_pos, line_start, section_type, title, None)
+                continue
+            
+            # 当前边界已确定，上一个边界在此处结束；排除章节仅用于截断前一章节
+            if closed is not None and closed.type not in self.EXCLUDE_TYPES:
+                yield closed._replace(end=current.line_start)
+            closed = current
+            current = Boundary(start_pos, line_start, section_type, title, None)
+        
+        if closed is not None and closed.type not in self.EXCLUDE_TYPES:
+            yield closed._replace(end=current.line_start)
+        if current is not None and current.type not in self.EXCLUDE_TYPES:
+            yield current._replace(end=len(text))
     
     def extract_sections(self, text: str) -> Dict[str, str]:
         """
@@ -236,34 +439,52 @@ class SectionFilter(LoggerMixin):
         if not text:
             return {}
         
-        boundaries = self.identify_section_boundaries(text)
+        # 以完整文本为键：字符串哈希值会缓存在对象上，命中时只需一次等值比较
+        section_spans = self._section_spans_cached(text)
         
-        if not boundaries:
-            self.logger.debug("未识别到章节结构，返回完整文本")
+        if section_spans is None:
             return {'full_text': text}
         
-        sections = {}
+        return {
+            section_type: _join_spans(text, spans)
+            for section_type, spans in section_spans.items()
+        }
+    
+    def _extract_section_spans(self, text: str) -> Optional[Dict[str, List[Tuple[int, int]]]]:
+        """
+        定位文本中的各个章节，只记录位置而不复制章节内容
         
-        for boundary in boundaries:
-            section_type = boundary['type']
-            start_pos = boundary['start']
-            end_pos = boundary['end']
+        Args:
+            text: 原始文本
             
-            # 提取章节内容
-            section_content = text[start_pos:end_pos].strip()
+        Returns:
+            章节位置字典 {章节类型: [(开始位置, 结束位置), ...]}，未识别到章节结构时返回 None
+        """
+        section_spans = defaultdict(list)
+        has_structure = False
+        
+        for boundary in self._iter_boundaries(text):
+            has_structure = True
+            
+            # 去除首尾空白（只移动下标，不生成子串）
+            start_pos, end_pos = boundary.start, boundary.end
+            while start_pos < end_pos and text[start_pos].isspace():
+                start_pos += 1
+            while end_pos > start_pos and text[end_pos - 1].isspace():
+                end_pos -= 1
             
             # 过滤太短的章节
-            if len(section_content) < 50:
+            if end_pos - start_pos < 50:
                 continue
             
             # 合并相同类型的章节（中英文）
-            base_type = section_type.replace('_zh', '')
-            if base_type in sections:
-                sections[base_type] += '\n\n' + section_content
-            else:
-                sections[base_type] = section_content
+            section_spans[_BASE_TYPES[boundary.type]].append((start_pos, end_pos))
+        
+        if not has_structure:
+            self.logger.debug("未识别到章节结构，返回完整文本")
+            return None
         
-        return sections
+        return dict(section_spans)
     
     def filter_relevant_sections(self, sections: Dict[str, str], 
                                 extraction_type: str = 'standard') -> Dict[str, str]:
@@ -280,18 +501,8 @@ class SectionFilter(LoggerMixin):
         if not sections:
             return {}
         
-        # 定义不同提取类型的相关章节
-        relevant_sections_map = {
-            'standard': ['abstract', 'introduction', 'methods', 'results', 'discussion', 'conclusion'],
-            'methodology': ['abstract', 'introduction', 'methods', 'materials'],
-            'results_focused': ['abstract', 'methods', 'results', 'discussion'],
-            'background_focused': ['abstract', 'introduction', 'background', 'literature_review'],
-            'biomarker': ['abstract', 'introduction', 'methods', 'results', 'discussion'],
-            'clinical': ['abstract', 'methods', 'results', 'clinical_implications', 'conclusion']
-        }
-        
-        relevant_sections = relevant_sections_map.get(extraction_type, 
-                                                    relevant_sections_map['standard'])
+        relevant_sections = self.RELEVANT_SECTIONS.get(extraction_type,
+                                                       self.RELEVANT_SECTIONS['standard'])
         
         # 筛选相关章节
         filtered_sections = {}
@@ -301,10 +512,9 @@ class SectionFilter(LoggerMixin):
         
         # 如果没有找到相关章节，返回所有非排除章节
         if not filtered_sections:
-            exclude_types = {'references', 'acknowledgments', 'funding', 'appendix', 'author_info'}
             filtered_sections = {
                 k: v for k, v in sections.items() 
-                if k not in exclude_types
+                if k not in self.EXCLUDE_TYPES
             }
         
         return filtered_sections
@@ -330,57 +540,64 @@ class SectionFilter(LoggerMixin):
         if total_length <= max_total_length:
             return sections
         
-        # 章节优先级和权重
-        section_priority = {
-            'abstract': 1.0,
-            'introduction': 0.8,
-            'methods': 0.9,
-            'results': 1.0,
-            'discussion': 0.8,
-            'conclusion': 0.7,
-            'background': 0.6,
-            'literature_review': 0.5,
-            'limitations': 0.6,
-            'future_work': 0.4
-        }
+        allocated_lengths = self._allocate_section_lengths(
+            {section_type: len(content) for section_type, content in sections.items()},
+            max_total_length
+        )
         
-        # 计算每个章节的分配长度
+        # 仅在确实需要截断时才生成新字符串
         prioritized_sections = {}
-        remaining_length = max_total_length
+        for section_type, allocated_length in allocated_lengths.items():
+            content = sections[section_type]
+            if allocated_length < len(content):
+                content = content[:allocated_length-3] + '...'
+            prioritized_sections[section_type] = content
         
-        # 按优先级排序
-        sorted_sections = sorted(
-            sections.items(),
-            key=lambda x: section_priority.get(x[0], 0.3),
-            reverse=True
-        )
+        return prioritized_sections
+    
+    def _allocate_section_lengths(self, section_lengths: Dict[str, int],
+                                  max_total_length: int) -> Dict[str, int]:
+        """
+        按重要性优先级为各章节分配保留长度
         
-        for section_type, content in sorted_sections:
-            if remaining_length <= 0:
-                break
+        Args:
+            section_lengths: 章节长度字典
+            max_total_length: 最大总长度
             
-            priority = section_priority.get(section_type, 0.3)
+        Returns:
+            按优先级顺序排列的 {章节类型: 保留长度}，小于原长度表示需要截断
+        """
+        # 按优先级建堆，逐个弹出；配额用完即停止，无需完整排序
+        # （以原始顺序作为次要键，同优先级保持原有顺序）
+        section_heap = [
+            (-_SECTION_PRIORITY.get(section_type, _DEFAULT_PRIORITY), order, section_type, length)
+            for order, (section_type, length) in enumerate(section_lengths.items())
+        ]
+        heapq.heapify(section_heap)
+        
+        # 计算每个章节的分配长度
+        allocated_lengths = {}
+        remaining_length = max_total_length
+        
+        while section_heap and remaining_length > 0:
+            neg_priority, _, section_type, content_length = heapq.heappop(section_heap)
+            budget = remaining_length * -neg_priority
             
-            # 计算该章节应分配的长度
-            if len(content) <= remaining_length * priority:
+            if content_length <= budget:
                 # 完整保留
-                prioritized_sections[section_type] = content
-                remaining_length -= len(content)
+                allocated_length = content_length
             else:
                 # 部分保留
-                allocated_length = max(int(remaining_length * priority), 500)
-                if allocated_length < len(content):
-                    truncated_content = content[:allocated_length-3] + '...'
-                    prioritized_sections[section_type] = truncated_content
-                    remaining_length -= allocated_length
-                else:
-                    prioritized_sections[section_type] = content
-                    remaining_length -= len(content)
-        
-        final_length = sum(len(content) for content in prioritized_sections.values())
-        self.logger.debug(f"章节优先级筛选: {total_length} -> {final_length} 字符")
+                allocated_length = min(max(int(budget), 500), content_length)
+            
+            allocated_lengths[section_type] = allocated_length
+            remaining_length -= allocated_length
         
-        return prioritized_sections
+        # 每个保留章节的长度都已从剩余配额中扣除
+        final_length = max_total_length - remaining_length
+        self.logger.debug(f"章节优先级筛选: {sum(section_lengths.values())} -> {final_length} 字符")
+        
+        return allocated_lengths
     
     def smart_section_selection(self, text: str, 
                               extraction_type: str = 'standard',
@@ -399,53 +616,107 @@ class SectionFilter(LoggerMixin):
         if not text or len(text) <= max_length:
             return text
         
+        # 仅略超长度，或开头没有任何章节标题特征时，直接截取比结构化提取更划算
+        if len(text) <= int(max_length * 1.1) or not _QUICK_PROBE.search(text[:2000]):
+            return text[:max_length-3] + '...'
+        
         self.logger.debug(f"开始智能章节选择: {len(text)} -> {max_length}")
         
-        # 提取章节
-        sections = self.extract_sections(text)
+        # 定位章节（只处理位置和长度，直到最终组合时才生成章节文本）
+        section_spans = self._section_spans_cached(text)
         
-        if not sections or 'full_text' in sections:
+        if not section_spans:
             # 没有识别到章节结构，使用简单截取
             return text[:max_length-3] + '...'
         
         # 过滤相关章节
-        relevant_sections = self.filter_relevant_sections(sections, extraction_type)
+        relevant_spans = self.filter_relevant_sections(section_spans, extraction_type)
         
         # 优先级筛选
-        prioritized_sections = self.prioritize_sections(relevant_sections, max_length)
+        section_lengths = {
+            section_type: _joined_length(spans)
+            for section_type, spans in relevant_spans.items()
+        }
+        if sum(section_lengths.values()) <= max_length:
+            allocated_lengths = section_lengths
+        else:
+            allocated_lengths = self._allocate_section_lengths(section_lengths, max_length)
         
         # 重新组合文本
-        if not prioritized_sections:
+        if not allocated_lengths:
             return text[:max_length-3] + '...'
         
-        # 按逻辑顺序排列章节
+        prioritized_sections = {
+            section_type: _join_spans(text, relevant_spans[section_type], allocated_length)
+            for section_type, allocated_length in allocated_lengths.items()
+        }
+        
+        # 按逻辑顺序排列章节，其他章节附在其后
         section_order = ['abstract', 'introduction', 'methods', 'results', 'discussion', 'conclusion']
+        ordered_types = [section_type for section_type in section_order if section_type in prioritized_sections]
+        ordered_types.extend(
+            section_type for section_type in prioritized_sections if section_type not in section_order
+        )
         
+        # 边拼接边累计长度，超出最大长度时立即截断，避免先生成完整文本再切片
         result_parts = []
-        for section_type in section_order:
-            if section_type in prioritized_sections:
-                content = prioritized_sections[section_type]
-                result_parts.append(f"=== {section_type.upper()} ===")
-                result_parts.append(content)
-                result_parts.append("")
-        
-        # 添加其他章节
-        for section_type, content in prioritized_sections.items():
-            if section_type not in section_order:
-                result_parts.append(f"=== {section_type.upper()} ===")
-                result_parts.append(content)
-                result_parts.append("")
-        
-        result_text = "\n".join(result_parts).strip()
-        
-        # 最终长度检查
-        if len(result_text) > max_length:
-            result_text = result_text[:max_length-3] + '...'
+        result_length = 0
+        result_text = None
+        for section_type in ordered_types:
+            separator = "\n\n" if result_parts else ""
+            for part in (f"{separator}=== {section_type.upper()} ===\n", prioritized_sections[section_type]):
+                if result_length + len(part) > max_length:
+                    head = "".join(result_parts) + part[:max(0, max_length - 3 - result_length)]
+                    result_text = head[:max_length-3] + '...'
+                    break
+                result_parts.append(part)
+                result_length += len(part)
+            if result_text is not None:
+                break
+        
+        if result_text is None:
+            result_text = "".join(result_parts)
         
         self.logger.debug(f"智能章节选择完成: {len(result_text)} 字符")
         
         return result_text
     
+    def filter_many(self, texts: List[str],
+                    extraction_type: str = 'standard',
+                    max_length: int = 15000,
+                    max_workers: Optional[int] = None) -> List[str]:
+        """
+        多进程批量执行智能章节选择
+        
+        Args:
+            texts: 原始文本列表
+            extraction_type: 提取类型
+            max_length: 最大长度
+            max_workers: 最大进程数，默认为 CPU 核数
+            
+        Returns:
+            与输入顺序一致的优化后文本列表
+        """
+        max_workers = max_workers or os.cpu_count() or 1
+        
+        # 文本太少或只有一个进程时，进程池开销得不偿失
+        if len(texts) < 2 or max_workers <= 1:
+            return [self.smart_section_selection(text, extraction_type, max_length) for text in texts]
+        
+        self.logger.debug(f"多进程章节选择: {len(texts)} 篇文本, {max_workers} 个进程")
+        
+        # 每个进程处理多篇文本，摊薄进程间通信开销
+        chunksize = max(1, len(texts) // (max_workers * 4))
+        
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 initializer=_init_worker_filter,
+                                 initargs=(self.config,)) as executor:
+            return list(executor.map(_worker_section_selection,
+                                     texts,
+                                     repeat(extraction_type),
+                                     repeat(max_length),
+                                     chunksize=chunksize))
+    
     def analyze_section_distribution(self, text: str) -> Dict[str, Any]:
         """
         分析文本的章节分布
@@ -518,4 +789,19 @@ class SectionFilter(LoggerMixin):
         elif present_count >= 2:
             return 'fair'
         else:
-            return 'poor'
\ No newline at end of file
+            return 'poor'
+
+
+# 工作进程内的章节过滤器实例，由进程池初始化函数创建
+_worker_filter: Optional[SectionFilter] = None
+
+
+def _init_worker_filter(config: Dict[str, Any]):
+    """进程池初始化：在工作进程中创建章节过滤器"""
+    global _worker_filter
+    _worker_filter = SectionFilter(config)
+
+
+def _worker_section_selection(text: str, extraction_type: str, max_length: int) -> str:
+    """在工作进程中执行智能章节选择"""
+    return _worker_filter.smart_section_selection(text, extraction_type, max_length)
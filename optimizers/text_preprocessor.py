@@ -5,14 +5,259 @@
 负责文本清理、格式化和优化，为后续处理做准备
 """
 
+import os
 import re
-from typing import Dict, List, Any, Optional, Tuple
+import hashlib
+import functools
+import heapq
+import importlib.util
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Dict, List, Any, Optional, Tuple, Pattern, Callable
 import logging
+import threading
+
+import numpy as np
 
 from utils.logger import LoggerMixin
 
 logger = logging.getLogger(__name__)
 
+# 尝试导入 hyperscan，用于章节标题的单遍多模式扫描
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+# 尝试导入 pyahocorasick，用于句子评分时的关键词多模式匹配
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# numba 用于句子评分的编译内核；导入耗时较长，只检查是否安装，首次评分时再导入（见 _get_score_kernel）
+NUMBA_AVAILABLE = importlib.util.find_spec('numba') is not None
+
+# 句子评分使用的关键词
+IMPORTANT_KEYWORDS = (
+    'method', 'result', 'conclusion', 'significant', 'important',
+    '方法', '结果', '结论', '显著', '重要', '发现', '表明', '证明'
+)
+
+# 章节模式的外层形式 \b(?:A|B|...)\b，拆分为各个分支交给 hyperscan
+_SECTION_ALTERNATION_RE = re.compile(r'^\\b\(\?:(.*)\)\\b$')
+
+# 编译后的正则表达式在进程内所有实例间共享：数字检测直接编译，其余在首次使用时编译
+_DIGIT_SEARCH = re.compile(r'\d').search
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_section_patterns() -> Dict[str, Pattern]:
+    """编译章节标题模式"""
+    return {
+        'abstract': re.compile(r'\b(?:abstract|摘要|summary)\b', re.IGNORECASE),
+        'introduction': re.compile(r'\b(?:introduction|引言|前言|背景|background)\b', re.IGNORECASE),
+        'methods': re.compile(r'\b(?:methods?|methodology|材料与方法|方法|materials?\s+and\s+methods?)\b', re.IGNORECASE),
+        'results': re.compile(r'\b(?:results?|findings|结果|发现)\b', re.IGNORECASE),
+        'discussion': re.compile(r'\b(?:discussion|讨论|分析)\b', re.IGNORECASE),
+        'conclusion': re.compile(r'\b(?:conclusions?|结论|总结)\b', re.IGNORECASE),
+        'references': re.compile(r'\b(?:references?|reference\s+list|bibliography|参考文献)\b', re.IGNORECASE),
+        'acknowledgments': re.compile(r'\b(?:acknowledgments?|acknowledgements?|致谢)\b', re.IGNORECASE),
+        'funding': re.compile(r'\b(?:funding|financial\s+support|资助|基金)\b', re.IGNORECASE)
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_section_title_pattern() -> Pattern:
+    """编译合并的章节标题模式"""
+    return re.compile(
+        r'(?:^|(?<=[\n\r]))(?:' +
+        '|'.join(f'(?P<{name}>{pattern.pattern})' for name, pattern in _compile_section_patterns().items()) +
+        ')',
+        re.IGNORECASE
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_cleanup_patterns() -> Dict[str, Pattern]:
+    """编译清理模式"""
+    return {
+        'multiple_spaces': re.compile(r'\s+'),
+        'multiple_newlines': re.compile(r'\n\s*\n\s*\n+'),
+        'email': re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'),
+        'url': re.compile(r'https?://[^\s<>"{}|\\^`[\]]+'),
+        'doi': re.compile(r'doi:\s*10\.\d+/[^\s]+', re.IGNORECASE),
+        'figure_ref': re.compile(r'\b(?:fig(?:ure)?\s*\.?\s*\d+|图\s*\d+)\b', re.IGNORECASE),
+        'table_ref': re.compile(r'\b(?:table\s*\.?\s*\d+|表\s*\d+)\b', re.IGNORECASE),
+        'citation': re.compile(r'\[\d+(?:[-–—,]\d+)*\]|\(\d+(?:[-–—,]\d+)*\)'),
+        'page_numbers': re.compile(r'\b(?:page|p\.)\s*\d+\b', re.IGNORECASE)
+    }
+
+
+def _combine_patterns(patterns: Dict[str, Pattern], names: List[str]) -> Pattern:
+    """
+    将多个已编译模式合并为一个命名分组交替模式
+    
+    Args:
+        patterns: 已编译模式字典
+        names: 参与合并的模式名（按优先顺序）
+        
+    Returns:
+        合并后的模式，匹配到的模式名可通过 match.lastgroup 获取
+    """
+    alternatives = []
+    for name in names:
+        pattern = patterns[name]
+        if pattern.flags & re.IGNORECASE:
+            alternatives.append(f'(?P<{name}>(?i:{pattern.pattern}))')
+        else:
+            alternatives.append(f'(?P<{name}>{pattern.pattern})')
+    return re.compile('|'.join(alternatives))
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_combined_cleanup() -> Tuple[Pattern, Pattern]:
+    """编译合并的清理模式"""
+    cleanup_patterns = _compile_cleanup_patterns()
+    return (
+        _combine_patterns(cleanup_patterns, ['url', 'email']),
+        _combine_patterns(cleanup_patterns, ['citation', 'figure_ref', 'table_ref', 'page_numbers'])
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _build_keyword_automaton() -> Optional[Any]:
+    """
+    构建句子评分关键词的 Aho-Corasick 自动机
+    
+    Returns:
+        自动机，pyahocorasick 不可用时为 None
+    """
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for keyword in IMPORTANT_KEYWORDS:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+@functools.lru_cache(maxsize=None)
+def _build_section_database() -> Tuple[Optional[Any], List[Tuple[str, int]]]:
+    """
+    构建章节标题的 hyperscan 数据库（进程内所有实例共享，暂存区由各线程单独分配）
+    
+    hyperscan 在 UCP 模式下不支持 \\b，且对同一结束位置只报告最左起点，
+    因此每个分支单独编译、去掉 \\b，并锚定在行首（^ 或 \\r 之后），
+    仅用于产生候选起点，再由原正则在候选位置上确认
+    
+    Returns:
+        (数据库, 表达式序号到 (章节名, 起点偏移) 的映射)，hyperscan 不可用时数据库为 None
+    """
+    if not HYPERSCAN_AVAILABLE:
+        return None, []
+    
+    expressions = []
+    names = []
+    for section_name, pattern in _compile_section_patterns().items():
+        alternation = _SECTION_ALTERNATION_RE.match(pattern.pattern)
+        branches = alternation.group(1).split('|') if alternation else [pattern.pattern.replace(r'\b', '')]
+        for branch in branches:
+            # Python 的 \s 额外包含 \x1c-\x1f，保证候选集合不少于原正则的匹配
+            branch = branch.replace(r'\s', r'[\s\x1c-\x1f]')
+            # 多行模式的 ^ 只认 \n，\r 之后的行首单独匹配，起点需后移一位
+            expressions.append(f'^{branch}'.encode('utf-8'))
+            names.append((section_name, 0))
+            expressions.append(f'\\r{branch}'.encode('utf-8'))
+            names.append((section_name, 1))
+    
+    flags = (hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST | hyperscan.HS_FLAG_MULTILINE |
+             hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP)
+    try:
+        database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        database.compile(expressions=expressions, ids=list(range(len(expressions))),
+                         elements=len(expressions), flags=[flags] * len(expressions))
+    except Exception as e:
+        logger.debug(f"hyperscan 数据库编译失败，使用 re 扫描: {e}")
+        return None, []
+    
+    return database, names
+
+
+def _score_kernel_numpy(lengths: np.ndarray, keyword_counts: np.ndarray, digit_flags: np.ndarray) -> np.ndarray:
+    """句子评分（NumPy 向量化版本）"""
+    # 长度分数（中等长度句子得分更高）
+    scores = np.maximum(0, 1.0 - np.abs(lengths - 100) / 200) * 0.3
+    
+    # 关键词分数（按出现的不同关键词计数）
+    scores += keyword_counts * 0.4
+    
+    # 数字分数（包含数字的句子可能更重要）
+    scores[digit_flags] += 0.2
+    
+    return scores
+
+
+def _score_kernel_loop(lengths: np.ndarray, keyword_counts: np.ndarray, digit_flags: np.ndarray) -> np.ndarray:
+    """句子评分（逐元素循环，供 numba 编译为单个融合循环，运算顺序与向量化版本一致）"""
+    scores = np.empty(lengths.size, dtype=np.float64)
+    for i in range(lengths.size):
+        score = max(0.0, 1.0 - abs(lengths[i] - 100) / 200) * 0.3
+        score += keyword_counts[i] * 0.4
+        if digit_flags[i]:
+            score += 0.2
+        scores[i] = score
+    return scores
+
+
+@functools.lru_cache(maxsize=None)
+def _get_score_kernel() -> Callable[[np.ndarray, np.ndarray, np.ndarray], np.ndarray]:
+    """
+    获取句子评分内核：首次调用时导入 numba 并编译（编译结果缓存到磁盘），
+    numba 不可用时使用 NumPy 向量化版本
+    
+    不启用 fastmath：重排浮点运算会改变分数，进而改变句子选择顺序
+    """
+    if NUMBA_AVAILABLE:
+        try:
+            from numba import njit
+            return njit(cache=True)(_score_kernel_loop)
+        except ImportError:
+            pass
+    return _score_kernel_numpy
+
+
+def _fused_sub(text: str, pattern: Pattern, replacements: Dict[str, str]) -> str:
+    """
+    用合并模式一次扫描完成替换：依次写入匹配间隙与替换标记，最后只拼接一次
+    
+    Args:
+        text: 原始文本
+        pattern: 命名分组合并模式
+        replacements: 分组名到替换文本的映射
+        
+    Returns:
+        替换后的文本，没有匹配时直接返回原字符串
+    """
+    pieces = []
+    last = 0
+    for match in pattern.finditer(text):
+        start, end = match.span()
+        pieces.append(text[last:start])
+        pieces.append(replacements[match.lastgroup])
+        last = end
+    
+    if not pieces:
+        return text
+    
+    pieces.append(text[last:])
+    return ''.join(pieces)
+
+
 class TextPreprocessor(LoggerMixin):
     """文本预处理器"""
     
@@ -28,36 +273,105 @@ class TextPreprocessor(LoggerMixin):
         self.max_section_length = config.get('max_section_length', 3000)
         self.compression_ratio = config.get('compression_ratio', 0.7)
         
-        # 预编译正则表达式
-        self._init_patterns()
-    
-    def _init_patterns(self):
-        """初始化正则表达式模式"""
-        # 章节标题模式
-        self.section_patterns = {
-            'abstract': re.compile(r'\b(?:abstract|摘要|summary)\b', re.IGNORECASE),
-            'introduction': re.compile(r'\b(?:introduction|引言|前言|背景|background)\b', re.IGNORECASE),
-            'methods': re.compile(r'\b(?:methods?|methodology|材料与方法|方法|materials?\s+and\s+methods?)\b', re.IGNORECASE),
-            'results': re.compile(r'\b(?:results?|findings|结果|发现)\b', re.IGNORECASE),
-            'discussion': re.compile(r'\b(?:discussion|讨论|分析)\b', re.IGNORECASE),
-            'conclusion': re.compile(r'\b(?:conclusions?|结论|总结)\b', re.IGNORECASE),
-            'references': re.compile(r'\b(?:references?|reference\s+list|bibliography|参考文献)\b', re.IGNORECASE),
-            'acknowledgments': re.compile(r'\b(?:acknowledgments?|acknowledgements?|致谢)\b', re.IGNORECASE),
-            'funding': re.compile(r'\b(?:funding|financial\s+support|资助|基金)\b', re.IGNORECASE)
+        # optimize_for_llm 结果缓存：以文本摘要为键，在同一实例上重复处理同一文献时直接命中；
+        # preprocess_batch 走进程池时由各工作进程的实例处理，不会命中这里的缓存
+        self.optimize_cache_size = config.get('optimize_cache_size', 256)
+        self._config_sig = (self.min_section_length, self.max_section_length, self.compression_ratio)
+        self._optimize_cache = OrderedDict()
+        self._optimize_cache_lock = threading.Lock()
+        
+        # hyperscan 暂存区同一时刻只能被一次扫描使用，多线程共享实例时每个线程各用一份
+        self._scan_local = threading.local()
+        
+        # 清理模式的替换标记
+        # 删除类模式（URL、邮箱）会让两侧文本拼接出新的匹配（如 "page <url> 12"），
+        # 因此先单独执行；其余模式替换为不含数字的标记，不会产生新的匹配
+        self.cleanup_replacements = {
+            'url': '',
+            'email': '',
+            'citation': '[REF]',
+            'figure_ref': '[FIGURE]',
+            'table_ref': '[TABLE]',
+            'page_numbers': ''
         }
         
-        # 清理模式
-        self.cleanup_patterns = {
-            'multiple_spaces': re.compile(r'\s+'),
-            'multiple_newlines': re.compile(r'\n\s*\n\s*\n+'),
-            'email': re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'),
-            'url': re.compile(r'https?://[^\s<>"{}|\\^`[\]]+'),
-            'doi': re.compile(r'doi:\s*10\.\d+/[^\s]+', re.IGNORECASE),
-            'figure_ref': re.compile(r'\b(?:fig(?:ure)?\s*\.?\s*\d+|图\s*\d+)\b', re.IGNORECASE),
-            'table_ref': re.compile(r'\b(?:table\s*\.?\s*\d+|表\s*\d+)\b', re.IGNORECASE),
-            'citation': re.compile(r'\[\d+(?:[-–—,]\d+)*\]|\(\d+(?:[-–—,]\d+)*\)'),
-            'page_numbers': re.compile(r'\b(?:page|p\.)\s*\d+\b', re.IGNORECASE)
-        }
+        # 正则表达式在首次访问时编译（见下方各 cached_property），只用到部分功能时不必全部编译；
+        # 编译结果由模块级缓存在所有实例间共享
+    
+    @functools.cached_property
+    def section_patterns(self) -> Dict[str, Pattern]:
+        """章节标题模式"""
+        return _compile_section_patterns()
+    
+    @functools.cached_property
+    def section_title_pattern(self) -> Pattern:
+        """合并的章节标题模式：只在行首匹配，一次扫描识别所有章节，章节名由 match.lastgroup 给出"""
+        return _compile_section_title_pattern()
+    
+    @functools.cached_property
+    def section_scanner(self) -> Tuple[Optional[Any], List[Tuple[str, int]]]:
+        """章节标题的 hyperscan 数据库及表达式映射（实例间共享，暂存区按线程分配）"""
+        return _build_section_database()
+    
+    @functools.cached_property
+    def keyword_automaton(self) -> Optional[Any]:
+        """句子评分关键词自动机（可选）"""
+        return _build_keyword_automaton()
+    
+    @functools.cached_property
+    def cleanup_patterns(self) -> Dict[str, Pattern]:
+        """清理模式"""
+        return _compile_cleanup_patterns()
+    
+    @functools.cached_property
+    def combined_cleanup(self) -> Tuple[Pattern, Pattern]:
+        """合并的清理模式：按原先的执行顺序分两组，每组一次扫描完成所有替换"""
+        return _compile_combined_cleanup()
+    
+    def _scan_section_candidates(self, text: str) -> List[Tuple[int, str]]:
+        """
+        使用 hyperscan 单遍扫描，返回行首的章节候选起点（字符偏移）
+        
+        Args:
+            text: 文本内容
+            
+        Returns:
+            候选列表 [(起点, 章节名), ...]，按起点升序，同一起点按章节模式顺序
+        """
+        data = text.encode('utf-8')
+        hits = []
+        
+        database, expression_names = self.section_scanner
+        
+        def on_match(expression_id, start, end, flags, context):
+            hits.append((start + expression_names[expression_id][1], expression_id))
+        
+        scratch = getattr(self._scan_local, 'scratch', None)
+        if scratch is None:
+            scratch = self._scan_local.scratch = hyperscan.Scratch(database)
+        
+        database.scan(data, match_event_handler=on_match, scratch=scratch)
+        
+        candidates = []
+        if not hits:
+            return candidates
+        
+        # 表达式序号按章节模式顺序分配，排序后同一起点的候选即按章节顺序排列
+        # \r 为单字节字符，后移一位后的起点仍在字符边界上
+        hits.sort()
+        ascii_only = len(data) == len(text)
+        byte_pos = char_pos = 0
+        for start, expression_id in hits:
+            # 匹配起点位于字符边界，增量解码即可把字节偏移换算为字符偏移
+            if not ascii_only and start != byte_pos:
+                char_pos += len(data[byte_pos:start].decode('utf-8'))
+                byte_pos = start
+            candidate = (char_pos if not ascii_only else start, expression_names[expression_id][0])
+            
+            if not candidates or candidates[-1] != candidate:
+                candidates.append(candidate)
+        
+        return candidates
     
     def clean_text(self, text: str, preserve_structure: bool = True) -> str:
         """
@@ -73,32 +387,18 @@ class TextPreprocessor(LoggerMixin):
         if not text:
             return ""
         
+        # 移除URL、邮箱和页码，简化引用格式
+        # URL 和邮箱必含 '://' 或 '@'，引用、图表和页码必含数字，不可能匹配时跳过对应的扫描
+        link_pattern, reference_pattern = self.combined_cleanup
         cleaned_text = text
-        
-        # 移除URL和邮箱
-        cleaned_text = self.cleanup_patterns['url'].sub('', cleaned_text)
-        cleaned_text = self.cleanup_patterns['email'].sub('', cleaned_text)
-        
-        # 简化引用格式
-        cleaned_text = self.cleanup_patterns['citation'].sub('[REF]', cleaned_text)
-        cleaned_text = self.cleanup_patterns['figure_ref'].sub('[FIGURE]', cleaned_text)
-        cleaned_text = self.cleanup_patterns['table_ref'].sub('[TABLE]', cleaned_text)
-        
-        # 移除页码
-        cleaned_text = self.cleanup_patterns['page_numbers'].sub('', cleaned_text)
-        
-        # 标准化空白字符
-        cleaned_text = self.cleanup_patterns['multiple_spaces'].sub(' ', cleaned_text)
-        
-        if preserve_structure:
-            # 保留段落结构，但限制连续换行
-            cleaned_text = self.cleanup_patterns['multiple_newlines'].sub('\n\n', cleaned_text)
-        else:
-            # 移除所有换行，转为单行
-            cleaned_text = cleaned_text.replace('\n', ' ')
-            cleaned_text = self.cleanup_patterns['multiple_spaces'].sub(' ', cleaned_text)
-        
-        return cleaned_text.strip()
+        if '://' in cleaned_text or '@' in cleaned_text:
+            cleaned_text = _fused_sub(cleaned_text, link_pattern, self.cleanup_replacements)
+        if _DIGIT_SEARCH(cleaned_text):
+            cleaned_text = _fused_sub(cleaned_text, reference_pattern, self.cleanup_replacements)
+        
+        # 标准化空白字符：str.split() 的空白定义与 \s 相同，拆分与合并均在 C 层完成
+        # 换行同样被合并为空格，因此无论是否保留结构，结果都是单行文本
+        return ' '.join(cleaned_text.split())
     
     def identify_sections(self, text: str) -> Dict[str, Tuple[int, int]]:
         """
@@ -111,21 +411,26 @@ class TextPreprocessor(LoggerMixin):
             章节位置字典 {章节名: (开始位置, 结束位置)}
         """
         sections = {}
-        text_lower = text.lower()
         
         # 找到所有可能的章节开始位置
+        # 章节模式均已忽略大小写，直接在原文上匹配，避免复制小写文本，偏移也与原文一致
         section_positions = []
         
-        for section_name, pattern in self.section_patterns.items():
-            for match in pattern.finditer(text_lower):
-                start_pos = match.start()
-                
-                # 检查是否在行首或前面是换行符
-                if start_pos == 0 or text[start_pos-1] in '\n\r':
-                    section_positions.append((start_pos, section_name))
-        
-        # 按位置排序
-        section_positions.sort(key=lambda x: x[0])
+        if self.section_scanner[0] is not None:
+            # 行首候选按升序确认，跳过落在上一个匹配内部的候选，与合并模式 finditer 的语义一致
+            last_end = 0
+            for start_pos, section_name in self._scan_section_candidates(text):
+                if start_pos < last_end:
+                    continue
+                match = self.section_patterns[section_name].match(text, start_pos)
+                if match is None:
+                    continue
+                last_end = match.end()
+                section_positions.append((start_pos, section_name))
+        else:
+            # 行首条件已写入合并模式，finditer 按位置升序产出，无需再排序
+            section_positions = [(match.start(), match.lastgroup)
+                                 for match in self.section_title_pattern.finditer(text)]
         
         # 确定每个章节的结束位置
         for i, (start_pos, section_name) in enumerate(section_positions):
@@ -212,15 +517,18 @@ class TextPreprocessor(LoggerMixin):
         # 计算句子重要性分数
         sentence_scores = self._score_sentences(sentences)
         
-        # 按分数排序并选择重要句子
-        scored_sentences = list(zip(sentences, sentence_scores, range(len(sentences))))
-        scored_sentences.sort(key=lambda x: (-x[1], x[2]))  # 按分数降序，位置升序
+        # 按分数降序、位置升序依次取句子，直到放不下为止
+        # 只有被选中的句子需要出堆，避免对全部句子排序
+        heap = [(-score, index) for index, score in enumerate(sentence_scores)]
+        heapq.heapify(heap)
         
         # 选择句子直到达到目标长度
         selected_sentences = []
         current_length = 0
         
-        for sentence, score, original_index in scored_sentences:
+        while heap:
+            original_index = heapq.heappop(heap)[1]
+            sentence = sentences[original_index]
             if current_length + len(sentence) <= target_length:
                 selected_sentences.append((sentence, original_index))
                 current_length += len(sentence)
@@ -262,41 +570,41 @@ class TextPreprocessor(LoggerMixin):
         Returns:
             分数列表
         """
-        scores = []
+        count = len(sentences)
+        if count == 0:
+            return []
         
-        # 关键词权重
-        important_keywords = [
-            'method', 'result', 'conclusion', 'significant', 'important',
-            '方法', '结果', '结论', '显著', '重要', '发现', '表明', '证明'
-        ]
+        # 逐句只做计数类工作，分数计算交给评分内核
+        lengths = np.fromiter((len(sentence) for sentence in sentences), dtype=np.int64, count=count)
+        keyword_counts = np.fromiter((self._count_keywords(sentence.lower()) for sentence in sentences),
+                                     dtype=np.int64, count=count)
+        digit_flags = np.fromiter((_DIGIT_SEARCH(sentence) is not None for sentence in sentences),
+                                  dtype=bool, count=count)
         
-        for sentence in sentences:
-            score = 0.0
-            sentence_lower = sentence.lower()
-            
-            # 长度分数（中等长度句子得分更高）
-            length_score = 1.0 - abs(len(sentence) - 100) / 200
-            score += max(0, length_score) * 0.3
-            
-            # 关键词分数
-            keyword_count = sum(1 for keyword in important_keywords 
-                              if keyword in sentence_lower)
-            score += keyword_count * 0.4
-            
-            # 数字分数（包含数字的句子可能更重要）
-            if re.search(r'\d+', sentence):
-                score += 0.2
-            
-            # 位置分数（开头和结尾的句子更重要）
-            # 这个在调用函数中处理
-            
-            scores.append(score)
+        scores = _get_score_kernel()(lengths, keyword_counts, digit_flags)
+        
+        # 位置分数（开头和结尾的句子更重要）
+        # 这个在调用函数中处理
         
-        return scores
+        return scores.tolist()
+    
+    def _count_keywords(self, sentence_lower: str) -> int:
+        """
+        统计句子中出现的不同关键词数量
+        
+        Args:
+            sentence_lower: 小写句子
+            
+        Returns:
+            关键词数量
+        """
+        if self.keyword_automaton is not None:
+            return len({keyword for _, keyword in self.keyword_automaton.iter(sentence_lower)})
+        return sum(1 for keyword in IMPORTANT_KEYWORDS if keyword in sentence_lower)
     
     def optimize_for_llm(self, text: str, max_tokens: int = 4000) -> str:
         """
-        为LLM优化文本
+        为LLM优化文本（按文本摘要缓存结果）
         
         Args:
             text: 原始文本
@@ -308,13 +616,48 @@ class TextPreprocessor(LoggerMixin):
         if not text:
             return ""
         
+        if self.optimize_cache_size <= 0:
+            return self._optimize_for_llm(text, max_tokens)
+        
+        key = (hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest(),
+               max_tokens, self._config_sig)
+        
+        # 读写缓存时持锁（OrderedDict 的 move_to_end/popitem 并发执行会破坏内部链表），计算过程不持锁
+        with self._optimize_cache_lock:
+            cached = self._optimize_cache.get(key)
+            if cached is not None:
+                self._optimize_cache.move_to_end(key)
+                return cached
+        
+        result = self._optimize_for_llm(text, max_tokens)
+        
+        with self._optimize_cache_lock:
+            self._optimize_cache[key] = result
+            while len(self._optimize_cache) > self.optimize_cache_size:
+                self._optimize_cache.popitem(last=False)
+        
+        return result
+    
+    def _optimize_for_llm(self, text: str, max_tokens: int) -> str:
+        """
+        为LLM优化文本（未缓存的实现）
+        
+        Args:
+            text: 原始文本
+            max_tokens: 最大token数（粗略估计）
+            
+        Returns:
+            优化后的文本
+        """
         # 粗略估计：1个token约等于4个字符（中英文混合）
         max_chars = max_tokens * 4
+        text_length = len(text)
         
-        if len(text) <= max_chars:
+        # 短文本（如仅有摘要）只需清理
+        if text_length <= max_chars:
             return self.clean_text(text)
         
-        self.logger.debug(f"文本过长（{len(text)}字符），开始优化...")
+        self.logger.debug(f"文本过长（{text_length}字符），开始优化...")
         
         # 提取关键章节
         key_sections = ['abstract', 'introduction', 'methods', 'results', 'discussion', 'conclusion']
@@ -322,7 +665,7 @@ class TextPreprocessor(LoggerMixin):
         
         if not sections:
             # 如果没有识别到章节，直接压缩
-            return self.compress_text(text, max_chars / len(text))
+            return self.compress_text(text, max_chars / text_length)
         
         # 按重要性分配字符配额
         section_quotas = {
@@ -362,47 +705,84 @@ class TextPreprocessor(LoggerMixin):
         
         return optimized_text
     
+    def _preprocess_paper(self, paper: Dict[str, Any],
+                          max_tokens: int) -> Tuple[Dict[str, Any], Optional[str]]:
+        """
+        预处理单篇文献
+        
+        Args:
+            paper: 文献记录
+            max_tokens: 最大token数
+            
+        Returns:
+            (预处理后的文献记录, 错误信息)，失败或没有全文时返回原始文献
+        """
+        full_text = paper.get('full_text', '')
+        
+        if not full_text:
+            return paper, None  # 没有全文的文献保持不变
+        
+        try:
+            # 优化文本
+            optimized_text = self.optimize_for_llm(full_text, max_tokens)
+            
+            # 更新文献记录（一次构建新字典，原始文献保持不变）
+            processed_paper = {
+                **paper,
+                'full_text': optimized_text,
+                'original_text_length': len(full_text),
+                'optimized_text_length': len(optimized_text),
+                'compression_ratio': len(optimized_text) / len(full_text)
+            }
+            
+            return processed_paper, None
+            
+        except Exception as e:
+            return paper, str(e)  # 保留原始文献
+    
     def preprocess_batch(self, papers: List[Dict[str, Any]], 
-                        max_tokens: int = 4000) -> List[Dict[str, Any]]:
+                        max_tokens: int = 4000,
+                        max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         批量预处理文献文本
         
         Args:
             papers: 文献列表
             max_tokens: 最大token数
+            max_workers: 最大进程数，默认为 CPU 核数
             
         Returns:
             预处理后的文献列表
         """
         self.logger.info(f"📝 开始批量预处理文本，共 {len(papers)} 篇文献")
         
-        processed_papers = []
+        max_workers = max_workers or os.cpu_count() or 1
         
-        for i, paper in enumerate(papers, 1):
-            self.logger.debug(f"预处理第 {i}/{len(papers)} 篇文献...")
+        # 文献太少或只有一个进程时，进程池开销得不偿失
+        if len(papers) < 4 or max_workers <= 1:
+            results = [self._preprocess_paper(paper, max_tokens) for paper in papers]
+        else:
+            self.logger.debug(f"多进程预处理: {len(papers)} 篇文献, {max_workers} 个进程")
             
-            full_text = paper.get('full_text', '')
+            # 每个进程处理多篇文献，摊薄进程间通信开销
+            chunksize = max(1, len(papers) // (max_workers * 4))
             
-            if full_text:
-                try:
-                    # 优化文本
-                    optimized_text = self.optimize_for_llm(full_text, max_tokens)
-                    
-                    # 更新文献记录
-                    processed_paper = paper.copy()
-                    processed_paper['full_text'] = optimized_text
-                    processed_paper['original_text_length'] = len(full_text)
-                    processed_paper['optimized_text_length'] = len(optimized_text)
-                    processed_paper['compression_ratio'] = len(optimized_text) / len(full_text) if full_text else 1.0
-                    
-                    processed_papers.append(processed_paper)
-                    
-                except Exception as e:
-                    pmid = paper.get('PMID', 'Unknown')
-                    self.logger.error(f"❌ 预处理文献 {pmid} 失败: {e}")
-                    processed_papers.append(paper)  # 保留原始文献
-            else:
-                processed_papers.append(paper)  # 没有全文的文献保持不变
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     initializer=_init_worker_preprocessor,
+                                     initargs=(self.config,)) as executor:
+                results = list(executor.map(_worker_preprocess_paper,
+                                            papers,
+                                            repeat(max_tokens),
+                                            chunksize=chunksize))
+        
+        # 日志统一在主进程输出
+        processed_papers = []
+        for i, (processed_paper, error) in enumerate(results, 1):
+            self.logger.debug(f"预处理第 {i}/{len(papers)} 篇文献...")
+            if error is not None:
+                pmid = processed_paper.get('PMID', 'Unknown')
+                self.logger.error(f"❌ 预处理文献 {pmid} 失败: {error}")
+            processed_papers.append(processed_paper)
         
         # 统计结果
         optimized_count = sum(1 for p in processed_papers if 'compression_ratio' in p)
@@ -411,4 +791,19 @@ class TextPreprocessor(LoggerMixin):
         self.logger.info(f"✅ 批量预处理完成: {optimized_count}/{len(papers)} 篇优化")
         self.logger.info(f"📊 平均压缩比: {avg_compression:.2f}")
         
-        return processed_papers
\ No newline at end of file
+        return processed_papers
+
+
+# 工作进程内的预处理器实例，由进程池初始化函数创建
+_worker_preprocessor: Optional[TextPreprocessor] = None
+
+
+def _init_worker_preprocessor(config: Dict[str, Any]):
+    """进程池初始化：在工作进程中创建文本预处理器"""
+    global _worker_preprocessor
+    _worker_preprocessor = TextPreprocessor(config)
+
+
+def _worker_preprocess_paper(paper: Dict[str, Any], max_tokens: int) -> Tuple[Dict[str, Any], Optional[str]]:
+    """在工作进程中预处理单篇文献"""
+    return _worker_preprocessor._preprocess_paper(paper, max_tokens)
@@ -6,15 +6,25 @@ API 管理模块
 """
 
 import time
+import bisect
+import asyncio
+import importlib.util
 import requests
 import logging
-from typing import Dict, Any, Optional, Callable
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from typing import Dict, Any, Optional, Callable, List
 from functools import wraps
 import threading
-from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
+# 需要重试的 HTTP 状态码
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# aiohttp 用于异步并发请求；导入耗时较长，只检查是否安装，首次异步调用时再导入
+AIOHTTP_AVAILABLE = importlib.util.find_spec('aiohttp') is not None
+
 
 class RateLimiter:
     """API 限流器"""
@@ -29,40 +39,108 @@ class RateLimiter:
         """
         self.max_calls = max_calls
         self.time_window = time_window
-        self.calls = []
-        self.lock = threading.Lock()
+        self.calls: List[float] = []  # 按时间顺序记录调用时刻（time.monotonic()）
+        self.condition = threading.Condition()
+
+    def _expire(self, now: float):
+        """移除过期的调用记录（记录按时间有序，二分查找截止位置后整段删除），调用方需持有锁"""
+        expired = bisect.bisect_right(self.calls, now - self.time_window)
+        if expired:
+            del self.calls[:expired]
 
     def can_call(self) -> bool:
         """检查是否可以调用"""
-        with self.lock:
-            now = datetime.now()
-            # 移除过期的调用记录
-            self.calls = [call_time for call_time in self.calls if now - call_time < timedelta(seconds=self.time_window)]
-
+        with self.condition:
+            self._expire(time.monotonic())
             return len(self.calls) < self.max_calls
 
     def record_call(self):
         """记录一次调用"""
-        with self.lock:
-            self.calls.append(datetime.now())
+        with self.condition:
+            self.calls.append(time.monotonic())
 
     def wait_if_needed(self):
-        """如果需要则等待"""
-        while not self.can_call():
-            time.sleep(0.1)
-        self.record_call()
+        """如果需要则等待，等到最早的调用记录过期为止，然后记录本次调用"""
+        with self.condition:
+            while True:
+                now = time.monotonic()
+                self._expire(now)
+                if len(self.calls) < self.max_calls:
+                    break
+                # 只有记录过期才会腾出名额，新增记录不会，因此无需 notify，按最早记录的过期时刻定时等待
+                self.condition.wait(timeout=self.time_window - (now - self.calls[0]))
+            self.calls.append(now)
+
+
+class _DelayRetry(Retry):
+    """按 with_retry 的退避规则等待的 urllib3 重试策略：第 n 次重试等待 retry_delay * retry_backoff**(n-1) 秒"""
+
+    def __init__(self, *args, retry_delay: float = 1.0, retry_backoff: float = 2.0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.retry_delay = retry_delay
+        self.retry_backoff = retry_backoff
+
+    def new(self, **kwargs) -> 'Retry':
+        retry = super().new(**kwargs)
+        retry.retry_delay = self.retry_delay
+        retry.retry_backoff = self.retry_backoff
+        return retry
+
+    def get_backoff_time(self) -> float:
+        if not self.history:
+            return 0
+        return self.retry_delay * (self.retry_backoff**(len(self.history) - 1))
+
+
+def build_retry(max_retries: int = 3,
+                retry_delay: float = 1.0,
+                backoff_factor: float = 2.0,
+                retry_on_status: Optional[list] = None) -> Retry:
+    """
+    按 with_retry 的参数构建传输层重试策略（次数、退避与重试状态码的含义与装饰器一致）
+
+    Args:
+        max_retries: 最大重试次数
+        retry_delay: 初始重试延迟
+        backoff_factor: 退避因子
+        retry_on_status: 需要重试的状态码列表，默认 RETRY_STATUS_CODES
+
+    Returns:
+        urllib3 重试策略
+    """
+    return _DelayRetry(total=max_retries,
+                       status_forcelist=RETRY_STATUS_CODES if retry_on_status is None else retry_on_status,
+                       allowed_methods=None,  # 与重试装饰器一致，POST 也重试
+                       respect_retry_after_header=True,
+                       raise_on_status=False,  # 重试用尽后返回最后的响应，由 raise_for_status 报错
+                       retry_delay=retry_delay,
+                       retry_backoff=backoff_factor)
 
 
 class APIManager:
     """API 管理器"""
 
-    def __init__(self):
+    def __init__(self, transport_retry: Optional[Retry] = None):
+        """
+        初始化 API 管理器
+
+        Args:
+            transport_retry: 传输层重试策略（可由 build_retry 构建），默认不在传输层重试；
+                传输层重试的请求不经过限流器计数，调用方需自行留出余量
+        """
         self.rate_limiters = {}
         self.session = requests.Session()
+        self.async_sessions = {}  # 事件循环 -> 异步会话，首次在该循环中异步调用时创建
 
         # 设置默认请求头
         self.session.headers.update({'User-Agent': 'PubMiner/1.0 (Literature Analysis Tool)'})
 
+        # 扩大连接池以支持并发调用；重试默认由调用方（如 with_retry）负责，传输层只在显式指定时重试
+        adapter = HTTPAdapter(max_retries=transport_retry if transport_retry is not None else 0,
+                              pool_connections=20, pool_maxsize=100)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
     def add_rate_limiter(self, api_name: str, max_calls: int, time_window: int):
         """
         添加 API 限流器
@@ -80,7 +158,7 @@ class APIManager:
                    backoff_factor: float = 2.0,
                    retry_on_status: Optional[list] = None):
         """
-        重试装饰器
+        重试装饰器（同步函数与协程函数均可），默认重试 RETRY_STATUS_CODES 与网络错误
 
         Args:
             max_retries: 最大重试次数
@@ -89,9 +167,11 @@ class APIManager:
             retry_on_status: 需要重试的状态码列表
         """
         if retry_on_status is None:
-            retry_on_status = [429, 500, 502, 503, 504]
+            retry_on_status = list(RETRY_STATUS_CODES)
 
         def decorator(func: Callable):
+            if asyncio.iscoroutinefunction(func):
+                return self._with_async_retry(func, max_retries, retry_delay, backoff_factor, retry_on_status)
 
             @wraps(func)
             def wrapper(*args, **kwargs):
@@ -131,6 +211,41 @@ class APIManager:
 
         return decorator
 
+    @staticmethod
+    def _with_async_retry(func: Callable, max_retries: int, retry_delay: float, backoff_factor: float,
+                          retry_on_status: list) -> Callable:
+        """为协程函数添加重试（aiohttp 异常），退避策略与同步版本一致"""
+        if AIOHTTP_AVAILABLE:
+            import aiohttp
+            status_errors = (aiohttp.ClientResponseError,)
+            network_errors = (aiohttp.ClientError, asyncio.TimeoutError)
+        else:
+            status_errors = ()
+            network_errors = (asyncio.TimeoutError,)
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            for attempt in range(max_retries + 1):
+                try:
+                    return await func(*args, **kwargs)
+                except status_errors as e:
+                    if e.status in retry_on_status and attempt < max_retries:
+                        delay = retry_delay * (backoff_factor**attempt)
+                        logger.warning(f"API 调用失败 (状态码: {e.status})，"
+                                       f"{delay:.1f} 秒后重试 (第 {attempt + 1}/{max_retries} 次)")
+                        await asyncio.sleep(delay)
+                        continue
+                    raise
+                except network_errors as e:
+                    if attempt < max_retries:
+                        delay = retry_delay * (backoff_factor**attempt)
+                        logger.warning(f"网络错误，{delay:.1f} 秒后重试 (第 {attempt + 1}/{max_retries} 次): {e}")
+                        await asyncio.sleep(delay)
+                        continue
+                    raise
+
+        return wrapper
+
     def call_api(self,
                  url: str,
                  method: str = 'GET',
@@ -162,16 +277,10 @@ class APIManager:
         if api_name and api_name in self.rate_limiters:
             self.rate_limiters[api_name].wait_if_needed()
 
-        # 合并请求头
-        if headers:
-            request_headers = {**self.session.headers, **headers}
-        else:
-            request_headers = self.session.headers
-
-        # 发起请求
+        # 发起请求（会话请求头由 Session.prepare_request 自动合并）
         response = self.session.request(method=method,
                                         url=url,
-                                        headers=request_headers,
+                                        headers=headers,
                                         params=params,
                                         json=json_data,
                                         data=data,
@@ -183,6 +292,104 @@ class APIManager:
 
         return response
 
+    def _get_async_session(self) -> 'aiohttp.ClientSession':
+        """
+        获取（必要时创建）当前事件循环的异步会话，连接池在同一循环的多次调用间复用
+
+        aiohttp 会话绑定创建它的事件循环，因此按循环分别缓存；
+        已关闭循环的会话无法再使用，顺带移除
+        """
+        try:
+            import aiohttp
+        except ImportError:
+            raise ImportError("异步请求需要安装 aiohttp: pip install aiohttp")
+
+        loop = asyncio.get_running_loop()
+        for stale_loop in [l for l in self.async_sessions if l.is_closed()]:
+            self.async_sessions.pop(stale_loop).detach()
+
+        session = self.async_sessions.get(loop)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(limit=100, limit_per_host=20)
+            session = aiohttp.ClientSession(connector=connector,
+                                            headers=dict(self.session.headers),
+                                            timeout=aiohttp.ClientTimeout(total=30))
+            self.async_sessions[loop] = session
+        return session
+
+    async def async_call_api(self,
+                             url: str,
+                             method: str = 'GET',
+                             headers: Optional[Dict[str, str]] = None,
+                             params: Optional[Dict[str, Any]] = None,
+                             json_data: Optional[Dict[str, Any]] = None,
+                             data: Optional[Any] = None,
+                             timeout: int = 30,
+                             api_name: Optional[str] = None,
+                             **kwargs) -> 'aiohttp.ClientResponse':
+        """
+        统一异步 API 调用方法（基于 aiohttp，复用连接池）
+
+        Args:
+            url: 请求 URL
+            method: HTTP 方法
+            headers: 请求头
+            params: URL 参数
+            json_data: JSON 数据
+            data: 请求数据
+            timeout: 超时时间
+            api_name: API 名称（用于限流）
+            **kwargs: 其他 aiohttp 参数
+
+        Returns:
+            响应对象（响应体已读取，可直接调用 text()/json()）
+        """
+        import aiohttp
+
+        session = self._get_async_session()
+
+        # 应用限流（限流器是阻塞的，放到线程中等待，不阻塞事件循环）
+        if api_name and api_name in self.rate_limiters:
+            await asyncio.get_running_loop().run_in_executor(None, self.rate_limiters[api_name].wait_if_needed)
+
+        async with session.request(method=method,
+                                   url=url,
+                                   headers=headers,
+                                   params=params,
+                                   json=json_data,
+                                   data=data,
+                                   timeout=aiohttp.ClientTimeout(total=timeout),
+                                   **kwargs) as response:
+            await response.read()
+
+        # 检查响应状态
+        response.raise_for_status()
+
+        return response
+
+    async def gather_calls(self,
+                           urls: List[str],
+                           max_concurrency: int = 20,
+                           **kwargs) -> List[Any]:
+        """
+        并发执行多个异步 API 调用
+
+        Args:
+            urls: 请求 URL 列表
+            max_concurrency: 最大并发数
+            **kwargs: 传给 async_call_api 的参数
+
+        Returns:
+            与输入顺序一致的结果列表，失败的调用对应异常对象
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def call(url: str):
+            async with semaphore:
+                return await self.async_call_api(url, **kwargs)
+
+        return await asyncio.gather(*(call(url) for url in urls), return_exceptions=True)
+
     def get(self, url: str, **kwargs) -> requests.Response:
         """GET 请求"""
         return self.call_api(url, method='GET', **kwargs)
@@ -200,8 +407,33 @@ class APIManager:
         return self.call_api(url, method='DELETE', **kwargs)
 
     def close(self):
-        """关闭会话"""
+        """关闭同步会话和所有异步会话"""
         self.session.close()
+        self._close_async_sessions()
+
+    def _close_async_sessions(self):
+        """关闭所有缓存的异步会话，按各自事件循环的状态选择关闭方式"""
+        sessions, self.async_sessions = self.async_sessions, {}
+        for loop, session in sessions.items():
+            if session.closed:
+                continue
+            if loop.is_closed():
+                # 循环已关闭，连接随之失效，只需将会话置为关闭状态
+                session.detach()
+            elif not loop.is_running():
+                loop.run_until_complete(session.close())
+            elif _running_loop() is loop:
+                # 在该循环内同步调用，无法等待，交给循环稍后关闭
+                loop.create_task(session.close())
+            else:
+                asyncio.run_coroutine_threadsafe(session.close(), loop)
+
+    async def aclose(self):
+        """关闭异步会话：等待当前事件循环的会话关闭，其他循环的会话按其状态关闭"""
+        session = self.async_sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None and not session.closed:
+            await session.close()
+        self._close_async_sessions()
 
     def __enter__(self):
         return self
@@ -209,6 +441,21 @@ class APIManager:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
 
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+        self.session.close()
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """返回当前线程正在运行的事件循环，没有则返回 None"""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
 
 # 全局 API 管理器实例
 api_manager = APIManager()
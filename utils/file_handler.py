@@ -6,16 +6,276 @@
 """
 
 import os
+import re
+import csv
+import math
 import json
+import hashlib
+import itertools
+import importlib.util
+import mmap
+import time
+import atexit
 import shutil
+import stat
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 import tempfile
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 尝试导入 orjson，加速 JSON 序列化与解析
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# 尝试导入 ijson，流式解析大型 JSON PMID 数组
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# fcntl 仅在类 Unix 系统可用，用于 FICLONE 写时复制克隆
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+# Linux FICLONE ioctl 请求码（_IOW(0x94, 9, int)）
+_FICLONE = 0x40049409
+
+# orjson 支持的最大嵌套深度
+_ORJSON_MAX_DEPTH = 254
+
+# 19 位及以上的连续数字：负数 19 位即可低于 int64 下限，正数 20 位可超过 uint64 上限
+_LONG_DIGITS_SEARCH = re.compile(rb'\d{19}').search
+
+# 交给 orjson 序列化的数据只能由这些类型组成（精确类型，不含子类）
+_ORJSON_SCALAR_TYPES = frozenset({str, int, bool, float, type(None)})
+_ORJSON_TYPES = _ORJSON_SCALAR_TYPES | {dict, list, tuple}
+
+# pyarrow 仅在读取 CSV 时按需导入，这里只检查是否安装
+PYARROW_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+
+# save_json 批量写回的最短间隔（秒）
+JSON_FLUSH_INTERVAL = 5.0
+
+# 待写回的 JSON：路径 -> (数据, 是否备份)，由后台线程按间隔写出
+_pending_json: Dict[Path, Tuple[Any, bool]] = {}
+_pending_lock = threading.Lock()
+_pending_event = threading.Event()
+_flush_lock = threading.Lock()
+_flusher: Optional[threading.Thread] = None
+
+# load_json 每线程复用的读缓冲区；超过上限的大缓冲区用完即释放，不长期占用内存
+JSON_READ_BUFFER_SIZE = 1 << 20
+JSON_READ_BUFFER_LIMIT = 8 << 20
+_read_buffers = threading.local()
+
+# 纯文本 PMID 文件按块扫描的块大小（字节）
+PMID_TEXT_CHUNK_SIZE = 1 << 20
+
+# 纯数字 PMID 块允许出现的字节：数字、空格、制表符与换行
+_PMID_TEXT_BYTES = b'0123456789 \t\r\n'
+
+# JSON PMID 文件超过该大小（字节）且安装了 ijson 时流式解析
+PMID_JSON_STREAM_THRESHOLD = 32 << 20
+
+# CSV PMID 文件分块读取的默认块大小（行）
+PMID_CSV_CHUNK_SIZE = 200_000
+
+# 本进程写入过的文件：路径 -> (内容摘要, 大小, 修改时间)，按写入先后排列，用于跳过未变化的写入
+WRITTEN_RECORD_LIMIT = 4096
+_written_files: Dict[Path, Tuple[bytes, int, int]] = {}
+_written_lock = threading.Lock()
+
+# 原子写入临时文件名的序号
+_temp_counter = itertools.count()
+
+# get_temp_file 使用的进程级临时目录：(所属进程 PID, 目录路径)，文件名按序号分配
+_temp_pool: Optional[Tuple[int, str]] = None
+_temp_pool_lock = threading.Lock()
+_temp_file_counter = itertools.count()
+
+
+def _as_path(path: Union[str, Path]) -> Path:
+    """转换为 Path；已经是 Path 时直接返回，不再构造新对象"""
+    return path if isinstance(path, Path) else Path(path)
+
+
+def _clone_file(src: Path, dst: Path):
+    """
+    复制文件内容并保留元数据（与 shutil.copy2 相同）
+
+    依次尝试 FICLONE 写时复制克隆（btrfs/XFS 等）与 os.copy_file_range（内核内复制），
+    均不支持时回退到 shutil.copyfile
+    """
+    copied = False
+    if sys.platform.startswith('linux'):
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            if FCNTL_AVAILABLE:
+                try:
+                    fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+                    copied = True
+                except OSError:
+                    pass
+
+            if not copied and hasattr(os, 'copy_file_range'):
+                try:
+                    remaining = os.fstat(fsrc.fileno()).st_size
+                    while remaining > 0:
+                        count = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                        if count == 0:
+                            break
+                        remaining -= count
+                    copied = remaining <= 0
+                except OSError:
+                    pass
+
+    if not copied:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+def _orjson_compatible(data: Any) -> bool:
+    """
+    检查数据能否交给 orjson 序列化，且结果与标准库 json 读回后相同
+
+    输出文本并非逐字节一致：浮点数指数写法不同（orjson 写 1e16，标准库写 1e+16），但读回的值相同。
+    orjson 会把 NaN/Infinity 写成 null，并能序列化 datetime、UUID、Enum、numpy 等标准库会报错的类型；
+    因此只接受由 str/int/bool/None、有限浮点数、以字符串为键的 dict 以及 list/tuple 组成的数据，
+    其余情况（含子类、共享或循环引用）回退到标准库。按层遍历，每层的类型检查在 C 中批量完成
+    """
+    level = [data]
+    seen = set()
+    for _ in range(_ORJSON_MAX_DEPTH):
+        types = set(map(type, level))
+        if not _ORJSON_TYPES.issuperset(types):
+            return False
+        if float in types and not all(map(math.isfinite, [value for value in level if type(value) is float])):
+            return False
+        if _ORJSON_SCALAR_TYPES.issuperset(types):
+            return True
+
+        dicts = [value for value in level if type(value) is dict] if dict in types else []
+        sequences = [value for value in level if type(value) is list or type(value) is tuple]
+        containers = set(map(id, itertools.chain(dicts, sequences)))
+        if len(containers) != len(dicts) + len(sequences) or not seen.isdisjoint(containers):
+            return False
+        seen |= containers
+
+        if dicts and not {str}.issuperset(map(type, itertools.chain.from_iterable(dicts))):
+            return False
+        level = list(itertools.chain(itertools.chain.from_iterable(map(dict.values, dicts)),
+                                     itertools.chain.from_iterable(sequences)))
+    return False
+
+
+def _dumps_json(data: Any) -> bytes:
+    """序列化为缩进 2 格的 UTF-8 JSON；orjson 无法得到等价结果的数据（如 NaN、超过 64 位的整数）回退到标准库"""
+    if ORJSON_AVAILABLE and _orjson_compatible(data):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _loads_json(raw: Union[bytes, memoryview]) -> Any:
+    """解析 UTF-8 JSON；orjson 拒绝的内容（如 NaN）或可能含超过 64 位整数的内容回退到标准库"""
+    # orjson 会把超出 int64/uint64 范围的整数读成浮点数；19 位以上的连续数字才可能超出范围
+    if ORJSON_AVAILABLE and not _LONG_DIGITS_SEARCH(raw):
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(str(raw, 'utf-8'))
+
+
+def _load_json_file(file_path: Path) -> Any:
+    """将 JSON 文件读入当前线程复用的缓冲区后解析，避免每次读取都分配新的 bytes 对象"""
+    with open(file_path, 'rb', buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        buffer = getattr(_read_buffers, 'buffer', None)
+        if buffer is None or len(buffer) <= size:
+            buffer = bytearray(max(size + 1, JSON_READ_BUFFER_SIZE))
+            if len(buffer) <= JSON_READ_BUFFER_LIMIT:
+                _read_buffers.buffer = buffer
+
+        with memoryview(buffer) as view:
+            length = 0
+            while length < len(buffer):
+                count = f.readinto(view[length:])
+                if not count:
+                    break
+                length += count
+            else:
+                # 读取期间文件变大，缓冲区已满，改为整体读取
+                f.seek(0)
+                return _loads_json(f.read())
+
+            return _loads_json(view[:length])
+
+
+def _flush_pending_json():
+    """写出所有待写回的 JSON 文件"""
+    # 写回串行执行：退出时的写出会等待后台线程正在进行的写出完成
+    with _flush_lock:
+        with _pending_lock:
+            pending = list(_pending_json.items())
+
+        # 写出后才移除；写出期间被再次标记的文件保留到下一次写回
+        for file_path, entry in pending:
+            data, backup = entry
+            FileHandler._write_json(data, file_path, backup)
+            with _pending_lock:
+                if _pending_json.get(file_path) is entry:
+                    del _pending_json[file_path]
+
+
+def _flusher_loop():
+    """后台写回线程：有新的待写数据时，等待一个间隔以合并后续写入，再统一写出"""
+    while True:
+        _pending_event.wait()
+        time.sleep(JSON_FLUSH_INTERVAL)
+        _pending_event.clear()
+        _flush_pending_json()
+
+
+def _ensure_flusher():
+    """按需启动后台写回线程"""
+    global _flusher
+    with _pending_lock:
+        if _flusher is None:
+            _flusher = threading.Thread(target=_flusher_loop, name='pubminer-json-flusher', daemon=True)
+            _flusher.start()
+            atexit.register(_flush_pending_json)
+
+
+def _get_temp_pool_dir() -> str:
+    """
+    返回当前进程的临时文件目录，首次调用时创建并在退出时删除（子进程各自创建）
+
+    调用方需持有 _temp_pool_lock，并在释放锁之前完成目录内的文件创建，
+    否则 clean_temp_files 可能在此期间删除整个目录
+    """
+    global _temp_pool
+    pid = os.getpid()
+    if _temp_pool is None or _temp_pool[0] != pid:
+        pool_dir = tempfile.mkdtemp(prefix='pubminer_pool_')
+        atexit.register(shutil.rmtree, pool_dir, ignore_errors=True)
+        _temp_pool = (pid, pool_dir)
+    return _temp_pool[1]
+
 
 class FileHandler:
     """文件处理工具类"""
@@ -23,7 +283,7 @@ class FileHandler:
     @staticmethod
     def ensure_dir(path: Union[str, Path]) -> Path:
         """确保目录存在"""
-        path = Path(path)
+        path = _as_path(path)
         path.mkdir(parents=True, exist_ok=True)
         return path
 
@@ -39,16 +299,15 @@ class FileHandler:
         Returns:
             JSON 数据或默认值
         """
-        file_path = Path(file_path)
+        file_path = _as_path(file_path)
 
-        if not file_path.exists():
+        # 直接打开文件，不存在时由异常判断，省去一次 exists 检查
+        try:
+            return _load_json_file(file_path)
+        except (FileNotFoundError, NotADirectoryError):
             if default is None:
-                raise FileNotFoundError(f"文件不存在: {file_path}")
+                raise FileNotFoundError(f"文件不存在: {file_path}") from None
             return default
-
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
         except json.JSONDecodeError as e:
             logger.error(f"JSON 解码错误 {file_path}: {e}")
             if default is None:
@@ -61,10 +320,51 @@ class FileHandler:
             return default
 
     @staticmethod
-    def save_json(data: Any, file_path: Union[str, Path], backup: bool = True) -> bool:
+    def save_json(data: Any, file_path: Union[str, Path], backup: bool = True, flush: str = 'immediate') -> bool:
         """
         保存 JSON 文件
 
+        Args:
+            data: 要保存的数据
+            file_path: 文件路径
+            backup: 是否创建备份
+            flush: 写入方式，'immediate' 立即写入；'batched' 标记为待写，
+                   由后台线程每 JSON_FLUSH_INTERVAL 秒合并写出一次（写出的是当时的数据状态），
+                   适合频繁更新同一文件的场景，程序退出时自动写出
+
+        Returns:
+            是否保存成功（批量模式下表示已加入待写队列）
+        """
+        file_path = _as_path(file_path)
+
+        if flush == 'batched':
+            with _pending_lock:
+                # 同一间隔内只在首次标记时决定是否备份，避免每次调用都复制文件
+                previous = _pending_json.get(file_path)
+                _pending_json[file_path] = (data, previous[1] if previous else backup)
+            _ensure_flusher()
+            _pending_event.set()
+            return True
+
+        if _flusher is None:
+            return FileHandler._write_json(data, file_path, backup)
+
+        # 使用过批量模式时，与后台写回串行执行，并丢弃同一文件尚未写出的旧数据
+        with _flush_lock:
+            with _pending_lock:
+                _pending_json.pop(file_path, None)
+            return FileHandler._write_json(data, file_path, backup)
+
+    @staticmethod
+    def flush_pending():
+        """立即写出所有以批量模式保存、尚未写回的 JSON 文件"""
+        _flush_pending_json()
+
+    @staticmethod
+    def _write_json(data: Any, file_path: Union[str, Path], backup: bool) -> bool:
+        """
+        写入 JSON 文件
+
         Args:
             data: 要保存的数据
             file_path: 文件路径
@@ -73,21 +373,17 @@ class FileHandler:
         Returns:
             是否保存成功
         """
-        file_path = Path(file_path)
+        file_path = _as_path(file_path)
 
         try:
-            # 确保目录存在
-            FileHandler.ensure_dir(file_path.parent)
-
-            # 创建备份
-            if backup and file_path.exists():
-                FileHandler.create_backup(file_path)
+            # 先序列化再写入，序列化失败时不会影响原文件
+            payload = _dumps_json(data)
 
             # 保存文件
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-
-            logger.debug(f"✅ JSON 文件保存成功: {file_path}")
+            if FileHandler._save_bytes(payload, file_path, backup):
+                logger.debug(f"✅ JSON 文件保存成功: {file_path}")
+            else:
+                logger.debug(f"JSON 文件内容未变化，跳过写入: {file_path}")
             return True
 
         except Exception as e:
@@ -106,7 +402,7 @@ class FileHandler:
         Returns:
             文件内容
         """
-        file_path = Path(file_path)
+        file_path = _as_path(file_path)
 
         if not file_path.exists():
             raise FileNotFoundError(f"文件不存在: {file_path}")
@@ -132,27 +428,155 @@ class FileHandler:
         Returns:
             是否保存成功
         """
-        file_path = Path(file_path)
+        file_path = _as_path(file_path)
 
         try:
-            # 确保目录存在
-            FileHandler.ensure_dir(file_path.parent)
-
-            # 创建备份
-            if backup and file_path.exists():
-                FileHandler.create_backup(file_path)
+            # 与文本模式写入一致，换行转换为平台换行符
+            if os.linesep != '\n':
+                content = content.replace('\n', os.linesep)
 
             # 保存文件
-            with open(file_path, 'w', encoding=encoding) as f:
-                f.write(content)
-
-            logger.debug(f"✅ 文本文件保存成功: {file_path}")
+            if FileHandler._save_bytes(content.encode(encoding), file_path, backup):
+                logger.debug(f"✅ 文本文件保存成功: {file_path}")
+            else:
+                logger.debug(f"文本文件内容未变化，跳过写入: {file_path}")
             return True
 
         except Exception as e:
             logger.error(f"❌ 文本文件保存失败 {file_path}: {e}")
             return False
 
+    @staticmethod
+    def save_many(items: List[Tuple[Union[str, Path], bytes]], backup: bool = True,
+                  max_workers: Optional[int] = None) -> List[bool]:
+        """
+        批量保存多个文件，使用线程池并发写入
+
+        每个文件仍走原子写入与按内容备份的流程；同一路径出现多次时按给定顺序依次写入
+
+        Args:
+            items: (文件路径, 文件内容) 列表
+            backup: 是否创建备份
+            max_workers: 最大线程数，默认由线程池决定
+
+        Returns:
+            与 items 顺序对应的保存结果
+        """
+        # 按路径分组，同一文件的多次写入在同一个任务中顺序完成
+        groups: Dict[Path, List[int]] = {}
+        for index, (file_path, _) in enumerate(items):
+            groups.setdefault(_as_path(file_path), []).append(index)
+
+        results = [False] * len(items)
+
+        def write_group(file_path: Path, indices: List[int]):
+            for index in indices:
+                try:
+                    FileHandler._save_bytes(items[index][1], file_path, backup)
+                    results[index] = True
+                except Exception as e:
+                    logger.error(f"❌ 文件保存失败 {file_path}: {e}")
+
+        if len(groups) <= 1:
+            for file_path, indices in groups.items():
+                write_group(file_path, indices)
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(write_group, groups.keys(), groups.values()))
+
+        logger.debug(f"批量保存完成: {sum(results)}/{len(items)} 个文件")
+        return results
+
+    @staticmethod
+    def _save_bytes(payload: bytes, file_path: Path, backup: bool) -> bool:
+        """
+        原子写入文件内容，仅在内容变化时备份旧文件
+
+        本进程上次写入的内容摘要、大小和修改时间记录在内存中；磁盘上的文件与记录一致时直接比较摘要，
+        没有记录时读取旧文件比较内容（大小不同则无需读取）。内容未变化时跳过备份和写入
+
+        Args:
+            payload: 文件内容
+            file_path: 文件路径
+            backup: 是否在覆盖前备份旧文件
+
+        Returns:
+            是否写入了文件（内容未变化时为 False）
+        """
+        digest = hashlib.blake2b(payload, digest_size=16).digest()
+
+        try:
+            current = file_path.stat()
+        except FileNotFoundError:
+            current = None
+            # 文件不存在时才需要确保目录存在
+            FileHandler.ensure_dir(file_path.parent)
+
+        if current is not None:
+            with _written_lock:
+                record = _written_files.get(file_path)
+
+            if record is not None and record[1:] == (current.st_size, current.st_mtime_ns):
+                unchanged = record[0] == digest
+            elif current.st_size == len(payload):
+                try:
+                    unchanged = file_path.read_bytes() == payload
+                except OSError:
+                    unchanged = False
+            else:
+                unchanged = False
+
+            if unchanged:
+                return False
+
+            # 创建备份
+            if backup:
+                FileHandler.create_backup(file_path)
+
+        FileHandler._atomic_write_bytes(file_path, payload)
+
+        written = file_path.stat()
+        with _written_lock:
+            _written_files.pop(file_path, None)
+            _written_files[file_path] = (digest, written.st_size, written.st_mtime_ns)
+            # 超出上限时丢弃最早的记录，之后对这些文件改为比较磁盘内容
+            while len(_written_files) > WRITTEN_RECORD_LIMIT:
+                del _written_files[next(iter(_written_files))]
+        return True
+
+    @staticmethod
+    def _atomic_write_bytes(file_path: Path, payload: bytes):
+        """
+        原子写入：先写入同目录下的临时文件，再用 os.replace 替换目标文件
+
+        Args:
+            file_path: 文件路径
+            payload: 文件内容
+        """
+        temp_path = file_path.with_name(f'.{file_path.name}.{os.getpid()}.{next(_temp_counter)}.tmp')
+
+        # 新文件按 umask 创建；覆盖已有文件时沿用原文件权限
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o666)
+        try:
+            # 内容已是编码好的字节，直接用 os.write 写入，不经过文件对象的缓冲区
+            try:
+                view = memoryview(payload)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
+            try:
+                shutil.copymode(file_path, temp_path)
+            except FileNotFoundError:
+                pass
+            os.replace(temp_path, file_path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+
     @staticmethod
     def create_backup(file_path: Union[str, Path], backup_dir: Optional[Path] = None) -> Optional[Path]:
         """
@@ -165,7 +589,7 @@ class FileHandler:
         Returns:
             备份文件路径，失败返回 None
         """
-        file_path = Path(file_path)
+        file_path = _as_path(file_path)
 
         if not file_path.exists():
             logger.warning(f"要备份的文件不存在: {file_path}")
@@ -183,8 +607,8 @@ class FileHandler:
             backup_name = f"{file_path.stem}_{timestamp}{file_path.suffix}"
             backup_path = backup_dir / backup_name
 
-            # 复制文件
-            shutil.copy2(file_path, backup_path)
+            # 复制文件：支持的文件系统上为写时复制克隆，不复制数据
+            _clone_file(file_path, backup_path)
             logger.debug(f"✅ 创建备份成功: {backup_path}")
             return backup_path
 
@@ -193,7 +617,8 @@ class FileHandler:
             return None
 
     @staticmethod
-    def load_pmid_list(file_path: Union[str, Path]) -> List[str]:
+    def load_pmid_list(file_path: Union[str, Path], chunk_size: int = PMID_CSV_CHUNK_SIZE,
+                       dedupe: bool = True) -> List[str]:
         """
         从文件加载 PMID 列表
 
@@ -204,11 +629,13 @@ class FileHandler:
 
         Args:
             file_path: 文件路径
+            chunk_size: CSV 文件每次读取的行数，内存占用只与块大小有关
+            dedupe: 是否去除重复的 PMID（保留首次出现的顺序）
 
         Returns:
             PMID 列表
         """
-        file_path = Path(file_path)
+        file_path = _as_path(file_path)
 
         if not file_path.exists():
             raise FileNotFoundError(f"PMID 文件不存在: {file_path}")
@@ -217,29 +644,163 @@ class FileHandler:
             suffix = file_path.suffix.lower()
 
             if suffix == '.json':
-                data = FileHandler.load_json(file_path)
-                if isinstance(data, list):
-                    return [str(pmid).strip() for pmid in data if str(pmid).strip()]
-                else:
-                    raise ValueError("JSON 文件应包含 PMID 数组")
+                pmids = FileHandler._load_pmid_json_stream(file_path)
+                if pmids is None:
+                    data = FileHandler.load_json(file_path)
+                    if isinstance(data, list):
+                        pmids = [pmid for pmid in map(str.strip, map(str, data)) if pmid]
+                    else:
+                        raise ValueError("JSON 文件应包含 PMID 数组")
 
             elif suffix == '.csv':
-                import pandas as pd
-                df = pd.read_csv(file_path)
-                # 假设第一列是 PMID
-                first_col = df.iloc[:, 0]
-                return [str(pmid).strip() for pmid in first_col if str(pmid).strip() and str(pmid) != 'nan']
+                pmids = FileHandler._load_pmid_csv(file_path, chunk_size)
 
             else:
                 # 纯文本文件
-                content = FileHandler.load_text(file_path)
-                lines = content.strip().split('\n')
-                return [line.strip() for line in lines if line.strip()]
+                pmids = FileHandler._load_pmid_text(file_path)
+
+            # dict.fromkeys 去重并保持原顺序
+            return list(dict.fromkeys(pmids)) if dedupe else pmids
 
         except Exception as e:
             logger.error(f"加载 PMID 列表失败 {file_path}: {e}")
             raise
 
+    @staticmethod
+    def _load_pmid_json_stream(file_path: Path) -> Optional[List[str]]:
+        """
+        流式解析大型 JSON PMID 数组，逐个元素处理，不构建完整的中间列表
+
+        Args:
+            file_path: 文件路径
+
+        Returns:
+            PMID 列表；未安装 ijson、文件较小或顶层不是数组时返回 None，由调用方整体解析
+        """
+        if not IJSON_AVAILABLE or os.stat(file_path).st_size < PMID_JSON_STREAM_THRESHOLD:
+            return None
+
+        with open(file_path, 'rb') as f:
+            # 顶层不是数组时交给整体解析，保持原有的错误提示
+            if not f.read(4096).lstrip().startswith(b'['):
+                return None
+            f.seek(0)
+
+            # use_float: 小数按 float 返回，与整体解析得到的字符串形式一致
+            items = ijson.items(f, 'item', use_float=True)
+            return [pmid for pmid in map(str.strip, map(str, items)) if pmid]
+
+    @staticmethod
+    def _load_pmid_csv(file_path: Path, chunk_size: int) -> List[str]:
+        """
+        分块读取 CSV 文件第一列中的 PMID
+
+        只解析第一列，并按字符串读取，避免缺失值把整列转成浮点数（如 "123.0"）。
+        逐块追加到结果列表，不会一次性构建整个 DataFrame；每块行数远小于 2^31，
+        也不会触及 pandas 单块行数的 int32 上限。
+
+        Args:
+            file_path: 文件路径
+            chunk_size: 每次读取的行数
+
+        Returns:
+            PMID 列表
+        """
+        pmids: List[str] = []
+        pmids_extend = pmids.extend
+
+        first_name = FileHandler._csv_first_column(file_path) if PYARROW_AVAILABLE else None
+        if first_name:
+            # pyarrow 流式读取：按列名只转换第一列，逐个记录批次处理
+            import pyarrow as pa
+            from pyarrow import csv as pa_csv
+            convert_options = pa_csv.ConvertOptions(include_columns=[first_name],
+                                                    column_types={first_name: pa.string()},
+                                                    strings_can_be_null=True)
+            try:
+                with pa_csv.open_csv(file_path, convert_options=convert_options) as reader:
+                    for batch in reader:
+                        values = (value.strip() for value in batch.column(0).to_pylist() if value is not None)
+                        pmids_extend(pmid for pmid in values if pmid and pmid != 'nan')
+                return pmids
+            except pa.ArrowInvalid as e:
+                # pyarrow 要求每行列数一致，短行（如只有 PMID 的行）会报错；
+                # 不能跳过这些行（会丢失 PMID），改用 pandas 从头读取
+                logger.debug(f"pyarrow 无法解析 {file_path}，改用 pandas 读取: {e}")
+                pmids.clear()
+
+        import pandas as pd
+        with pd.read_csv(file_path, usecols=[0], dtype=str, chunksize=chunk_size, engine='c') as reader:
+            for chunk in reader:
+                col = chunk.iloc[:, 0].dropna().str.strip()
+                pmids_extend(col[(col.str.len() > 0) & (col != 'nan')].tolist())
+
+        return pmids
+
+    @staticmethod
+    def _csv_first_column(file_path: Path) -> Optional[str]:
+        """
+        读取 CSV 表头中第一列的列名
+
+        Args:
+            file_path: 文件路径
+
+        Returns:
+            列名，表头为空或与其他列重名时返回 None
+        """
+        with open(file_path, 'r', encoding='utf-8-sig', newline='') as f:
+            header = next(csv.reader(f), None)
+
+        if not header or not header[0] or header.count(header[0]) > 1:
+            return None
+        return header[0]
+
+    @staticmethod
+    def _load_pmid_text(file_path: Path) -> List[str]:
+        """
+        从纯文本文件加载 PMID 列表（每行一个）
+
+        通过 mmap 按块扫描：每块在换行处截断后解码并拆分，
+        峰值内存只包含一个块而不是整个文件的字符串副本
+
+        Args:
+            file_path: 文件路径
+
+        Returns:
+            PMID 列表
+        """
+        pmids = []
+
+        with open(file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return pmids
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                pos = 0
+                while pos < size:
+                    # 块尾取窗口内最后一个换行；整个窗口没有换行时延伸到下一个换行
+                    end = mm.rfind(b'\n', pos, pos + PMID_TEXT_CHUNK_SIZE) + 1
+                    if end <= pos:
+                        end = mm.find(b'\n', pos + PMID_TEXT_CHUNK_SIZE) + 1 or size
+
+                    chunk = mm[pos:end]
+                    pos = end
+
+                    # 快速路径：块内只有数字与空白，且每行至多一个数字串时，按空白拆分即得到各行 PMID
+                    if not chunk.translate(None, _PMID_TEXT_BYTES):
+                        tokens = chunk.decode('ascii').split()
+                        if (b' ' not in chunk and b'\t' not in chunk) or \
+                                len(tokens) == len(chunk.translate(None, b' \t').split()):
+                            pmids.extend(tokens)
+                            continue
+
+                    # 与文本模式读取一致，\r 与 \r\n 也视为换行（空行随后被过滤）
+                    lines = chunk.decode('utf-8').replace('\r', '\n').split('\n')
+                    pmids.extend(line for line in map(str.strip, lines) if line)
+
+        return pmids
+
     @staticmethod
     def get_temp_file(suffix: str = '', prefix: str = 'pubminer_') -> str:
         """
@@ -252,9 +813,17 @@ class FileHandler:
         Returns:
             临时文件路径
         """
-        fd, temp_path = tempfile.mkstemp(suffix=suffix, prefix=prefix)
-        os.close(fd)  # 关闭文件描述符，但保留文件
-        return temp_path
+        # 在进程级临时目录中按序号命名，不必像 mkstemp 那样随机生成并反复尝试；
+        # 持锁创建文件，避免 clean_temp_files 在取得目录与创建文件之间删除目录
+        with _temp_pool_lock:
+            pool_dir = _get_temp_pool_dir()
+            while True:
+                temp_path = os.path.join(pool_dir, f'{prefix}{next(_temp_file_counter)}{suffix}')
+                try:
+                    open(temp_path, 'xb').close()
+                    return temp_path
+                except FileExistsError:
+                    continue
 
     @staticmethod
     def get_temp_dir(prefix: str = 'pubminer_') -> str:
@@ -277,17 +846,51 @@ class FileHandler:
         Args:
             temp_paths: 临时文件路径列表
         """
-        for temp_path in temp_paths:
-            try:
-                temp_path = Path(temp_path)
-                if temp_path.exists():
-                    if temp_path.is_file():
-                        temp_path.unlink()
-                    elif temp_path.is_dir():
-                        shutil.rmtree(temp_path)
-                    logger.debug(f"✅ 清理临时文件: {temp_path}")
-            except Exception as e:
-                logger.warning(f"⚠️ 清理临时文件失败 {temp_path}: {e}")
+        global _temp_pool
+
+        # 快速路径：要清理的恰好是临时文件目录中的全部文件时，直接删除整个目录
+        with _temp_pool_lock:
+            if temp_paths and _temp_pool is not None and _temp_pool[0] == os.getpid():
+                pool_dir = _temp_pool[1]
+                names = {os.path.basename(p) for p in map(os.fspath, temp_paths)
+                         if os.path.dirname(os.fspath(p)) == pool_dir}
+                if len(names) == len(temp_paths):
+                    try:
+                        remaining = set(os.listdir(pool_dir))
+                    except OSError:
+                        remaining = None
+                    if remaining is not None and remaining <= names:
+                        shutil.rmtree(pool_dir, ignore_errors=True)
+                        _temp_pool = None
+                        logger.debug(f"✅ 清理临时文件目录: {pool_dir}")
+                        return
+
+        # 多个路径时用线程池并发删除，重叠各次删除的系统调用等待
+        if len(temp_paths) > 1:
+            with ThreadPoolExecutor(max_workers=min(32, len(temp_paths))) as executor:
+                list(executor.map(FileHandler._remove_temp_path, temp_paths))
+        else:
+            for temp_path in temp_paths:
+                FileHandler._remove_temp_path(temp_path)
+
+    @staticmethod
+    def _remove_temp_path(temp_path: Union[str, Path]):
+        """
+        删除单个临时文件或目录
+
+        Args:
+            temp_path: 临时文件或目录路径
+        """
+        try:
+            temp_path = _as_path(temp_path)
+            if temp_path.exists():
+                if temp_path.is_file():
+                    temp_path.unlink()
+                elif temp_path.is_dir():
+                    shutil.rmtree(temp_path)
+                logger.debug(f"✅ 清理临时文件: {temp_path}")
+        except Exception as e:
+            logger.warning(f"⚠️ 清理临时文件失败 {temp_path}: {e}")
 
     @staticmethod
     def get_file_info(file_path: Union[str, Path]) -> Dict[str, Any]:
@@ -298,24 +901,38 @@ class FileHandler:
             file_path: 文件路径
 
         Returns:
-            文件信息字典
+            文件信息字典，时间为时间戳（可用 format_ts 格式化）
         """
-        file_path = Path(file_path)
+        file_path = _as_path(file_path)
 
-        if not file_path.exists():
+        # 只调用一次 stat，类型判断由 st_mode 推出
+        try:
+            st = os.stat(file_path)
+        except (FileNotFoundError, NotADirectoryError):
             return {"exists": False}
 
-        stat = file_path.stat()
-
         return {
             "exists": True,
-            "size": stat.st_size,
-            "size_mb": round(stat.st_size / 1024 / 1024, 2),
-            "modified": datetime.fromtimestamp(stat.st_mtime),
-            "created": datetime.fromtimestamp(stat.st_ctime),
-            "is_file": file_path.is_file(),
-            "is_dir": file_path.is_dir(),
+            "size": st.st_size,
+            "size_mb": round(st.st_size / 1024 / 1024, 2),
+            "modified_ts": st.st_mtime,
+            "created_ts": st.st_ctime,
+            "is_file": stat.S_ISREG(st.st_mode),
+            "is_dir": stat.S_ISDIR(st.st_mode),
             "suffix": file_path.suffix,
             "name": file_path.name,
             "stem": file_path.stem
         }
+
+    @staticmethod
+    def format_ts(ts: float) -> str:
+        """
+        将时间戳格式化为本地时间的 ISO 字符串（精确到秒）
+
+        Args:
+            ts: 时间戳
+
+        Returns:
+            形如 2024-01-01T12:00:00 的字符串
+        """
+        return time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(ts))
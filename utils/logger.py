@@ -12,6 +12,36 @@ from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
+# 文件与控制台日志格式
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+LOG_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    缓存时间字符串的日志格式化器
+
+    指定 datefmt 时时间精度为秒，同一秒内的记录复用上一次格式化的时间字符串
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (秒, 时间字符串)，整体替换以保证多线程下读取一致
+        self._time_cache = (None, '')
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        if not datefmt:
+            return super().formatTime(record, datefmt)
+
+        second = int(record.created)
+        cached_second, cached_str = self._time_cache
+        if cached_second == second:
+            return cached_str
+
+        time_str = super().formatTime(record, datefmt)
+        self._time_cache = (second, time_str)
+        return time_str
+
 
 def setup_logger(level: int = logging.INFO,
                  log_dir: Optional[Path] = None,
@@ -37,7 +67,7 @@ def setup_logger(level: int = logging.INFO,
     logger.handlers.clear()
 
     # 设置日志格式
-    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+    formatter = CachedTimeFormatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
 
     # 控制台处理器
     if console:
@@ -52,16 +82,17 @@ def setup_logger(level: int = logging.INFO,
         log_dir.mkdir(parents=True, exist_ok=True)
 
         # 按日期创建日志文件
-        log_file = log_dir / f"pubminer_{datetime.now().strftime('%Y%m%d')}.log"
+        today = datetime.now().strftime('%Y%m%d')
+        log_file = log_dir / f"pubminer_{today}.log"
 
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        file_handler = logging.FileHandler(log_file, encoding='utf-8', delay=True)
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
         logger.addHandler(file_handler)
 
         # 错误日志单独文件
-        error_log_file = log_dir / f"pubminer_error_{datetime.now().strftime('%Y%m%d')}.log"
-        error_handler = logging.FileHandler(error_log_file, encoding='utf-8')
+        error_log_file = log_dir / f"pubminer_error_{today}.log"
+        error_handler = logging.FileHandler(error_log_file, encoding='utf-8', delay=True)
         error_handler.setLevel(logging.ERROR)
         error_handler.setFormatter(formatter)
         logger.addHandler(error_handler)
@@ -13,21 +13,12 @@ from typing import Optional, Dict, Any
 from contextlib import contextmanager
 
 from rich.console import Console
-from rich.logging import RichHandler
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, TimeElapsedColumn
-from rich.table import Table
-from rich.panel import Panel
-from rich.text import Text
-from rich.tree import Tree
-from rich.status import Status
-from rich.live import Live
-from rich.layout import Layout
-from rich.align import Align
-from rich.columns import Columns
-from rich.rule import Rule
-from rich import box
 from rich.theme import Theme
 
+from .logger import CachedTimeFormatter, LOG_FORMAT, LOG_DATE_FORMAT
+
+# 其余 Rich 组件在各方法中按需导入，只使用文件日志或不打印面板时不加载
+
 # 自定义主题
 PUBMINER_THEME = Theme({
     "info": "cyan",
@@ -81,6 +72,8 @@ class RichLogger:
 
     def _setup_logger(self, show_time: bool, show_path: bool) -> logging.Logger:
         """设置日志器"""
+        from rich.logging import RichHandler
+
         logger = logging.getLogger(self.name)
         logger.setLevel(self.level)
         logger.handlers.clear()
@@ -106,48 +99,59 @@ class RichLogger:
         self.log_dir.mkdir(parents=True, exist_ok=True)
 
         # 标准日志文件
-        log_file = self.log_dir / f"pubminer_{datetime.now().strftime('%Y%m%d')}.log"
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        today = datetime.now().strftime('%Y%m%d')
+        log_file = self.log_dir / f"pubminer_{today}.log"
+        file_handler = logging.FileHandler(log_file, encoding='utf-8', delay=True)
         file_handler.setLevel(self.level)
 
         # 文件日志格式（不包含 Rich 标记）
-        file_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+        file_formatter = CachedTimeFormatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
         file_handler.setFormatter(file_formatter)
         logger.addHandler(file_handler)
 
         # 错误日志文件
-        error_file = self.log_dir / f"pubminer_error_{datetime.now().strftime('%Y%m%d')}.log"
-        error_handler = logging.FileHandler(error_file, encoding='utf-8')
+        error_file = self.log_dir / f"pubminer_error_{today}.log"
+        error_handler = logging.FileHandler(error_file, encoding='utf-8', delay=True)
         error_handler.setLevel(logging.ERROR)
         error_handler.setFormatter(file_formatter)
         logger.addHandler(error_handler)
 
     def info(self, message: str, **kwargs):
         """信息日志"""
-        self.logger.info(f"[info]{message}[/info]", **kwargs)
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("[info]%s[/info]", message, **kwargs)
 
     def warning(self, message: str, **kwargs):
         """警告日志"""
-        self.logger.warning(f"[warning]{message}[/warning]", **kwargs)
+        if self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning("[warning]%s[/warning]", message, **kwargs)
 
     def error(self, message: str, **kwargs):
         """错误日志"""
-        self.logger.error(f"[error]{message}[/error]", **kwargs)
+        if self.logger.isEnabledFor(logging.ERROR):
+            self.logger.error("[error]%s[/error]", message, **kwargs)
 
     def success(self, message: str, **kwargs):
         """成功日志"""
-        self.logger.info(f"[success]✅ {message}[/success]", **kwargs)
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("[success]✅ %s[/success]", message, **kwargs)
 
     def debug(self, message: str, **kwargs):
         """调试日志"""
-        self.logger.debug(f"[debug]{message}[/debug]", **kwargs)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("[debug]%s[/debug]", message, **kwargs)
 
     def critical(self, message: str, **kwargs):
         """严重错误日志"""
-        self.logger.critical(f"[critical]{message}[/critical]", **kwargs)
+        if self.logger.isEnabledFor(logging.CRITICAL):
+            self.logger.critical("[critical]%s[/critical]", message, **kwargs)
 
     def print_header(self, title: str, subtitle: str = None):
         """打印标题头部"""
+        from rich import box
+        from rich.align import Align
+        from rich.panel import Panel
+
         if subtitle:
             header_text = f"[bold cyan]{title}[/bold cyan]\n[dim]{subtitle}[/dim]"
         else:
@@ -159,11 +163,16 @@ class RichLogger:
 
     def print_section(self, title: str):
         """打印章节分隔符"""
+        from rich.rule import Rule
+
         self.console.print(Rule(f"[bold yellow]{title}[/bold yellow]", style="yellow"))
         self.console.print()
 
     def print_table(self, title: str, data: list, headers: list):
         """打印表格"""
+        from rich import box
+        from rich.table import Table
+
         table = Table(title=title, box=box.ROUNDED, show_header=True, header_style="bold magenta")
 
         for header in headers:
@@ -177,6 +186,8 @@ class RichLogger:
 
     def print_tree(self, title: str, tree_data: dict):
         """打印树形结构"""
+        from rich.tree import Tree
+
         tree = Tree(f"[bold blue]{title}[/bold blue]")
 
         def add_items(parent, items):
@@ -200,6 +211,9 @@ class RichLogger:
 
     def print_status_panel(self, status_data: dict):
         """打印状态面板"""
+        from rich.columns import Columns
+        from rich.panel import Panel
+
         columns = []
 
         for key, value in status_data.items():
@@ -218,6 +232,8 @@ class RichLogger:
     @contextmanager
     def progress(self, description: str = "Processing..."):
         """进度条上下文管理器"""
+        from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, TimeElapsedColumn
+
         with Progress(SpinnerColumn(),
                       TextColumn("[progress.description]{task.description}"),
                       BarColumn(),
@@ -235,6 +251,8 @@ class RichLogger:
     @contextmanager
     def status(self, message: str):
         """状态指示器上下文管理器"""
+        from rich.status import Status
+
         with Status(f"[status]{message}[/status]", console=self.console, spinner="dots") as status:
             yield status
 
@@ -246,6 +264,9 @@ class RichLogger:
 
     def print_summary(self, title: str, summary_data: dict):
         """打印总结信息"""
+        from rich import box
+        from rich.table import Table
+
         self.print_section(title)
 
         # 成功 / 失败统计
@@ -272,6 +293,8 @@ class RichLogger:
 
     def print_error_details(self, error: Exception, context: str = None):
         """打印错误详情"""
+        from rich.panel import Panel
+
         error_panel = Panel(f"[error]{type(error).__name__}: {str(error)}[/error]",
                             title="[bold red] 错误详情 [/bold red]",
                             border_style="red",